@@ -5,6 +5,7 @@
  * - engine/control-flow.ts — if, switch, for-each, while, map, filter, reduce, parallel, try, script, wait, merge
  * - engine/retry.ts — RetryPolicy, CircuitBreaker
  * - engine/conditions.ts — condition evaluation
+ * - engine/dag.ts — step dependency analysis for concurrent scheduling
  * - engine/variable-resolution.ts — template and variable resolution
  * - engine/subworkflow.ts — sub-workflow and sub-agent execution
  * - engine/types.ts — shared type definitions
@@ -22,6 +23,7 @@ import {
   WorkflowStatus,
   createExecutionContext,
   createStepResult,
+  createSkippedStepResult,
   isActionStep,
   isSubWorkflowStep,
   isIfStep,
@@ -66,7 +68,9 @@ import { executeParallelOperation, isParallelOperation } from './parallel.js';
 
 // Engine sub-modules
 import { RetryPolicy, CircuitBreaker } from './engine/retry.js';
+import { Semaphore } from './engine/semaphore.js';
 import { evaluateConditions } from './engine/conditions.js';
+import { buildStepDag } from './engine/dag.js';
 import { resolveTemplates } from './engine/variable-resolution.js';
 import {
   executeIfStep,
@@ -118,14 +122,20 @@ interface InternalEngineConfig {
   maxRetries: number;
   retryBaseDelay: number;
   retryMaxDelay: number;
+  maxConcurrency: number;
+  maxServiceConcurrency: number;
   defaultAgent: string | undefined;
   defaultModel: string | undefined;
 }
 
+/** Shared by every engine using the default retry settings; RetryPolicy is immutable */
+const DEFAULT_RETRY_POLICY = new RetryPolicy();
+
 export class WorkflowEngine {
   private config: InternalEngineConfig;
   private retryPolicy: RetryPolicy;
   private circuitBreakers: Map<string, CircuitBreaker> = new Map();
+  private serviceSemaphores: Map<string, Semaphore> = new Map();
   private events: EngineEvents;
   private stateStore?: StateStore | undefined;
   private rollbackRegistry?: RollbackRegistry | undefined;
@@ -135,6 +145,12 @@ export class WorkflowEngine {
   public workflowPath?: string;
   private workflowPermissions?: Permissions;
   private promptCache: Map<string, LoadedPrompt> = new Map();
+  private executorContextCache = new WeakMap<WorkflowStep, {
+    workflowPermissions: Permissions | undefined;
+    defaultModel: string | undefined;
+    defaultAgent: string | undefined;
+    context: StepExecutorContext;
+  }>();
 
   constructor(config: EngineConfig = {}, events: EngineEvents = {}, stateStore?: StateStore) {
     this.config = {
@@ -142,15 +158,25 @@ export class WorkflowEngine {
       maxRetries: config.maxRetries ?? (process.env.MARKTOFLOW_MAX_RETRIES ? parseInt(process.env.MARKTOFLOW_MAX_RETRIES, 10) : 3),
       retryBaseDelay: config.retryBaseDelay ?? (process.env.MARKTOFLOW_RETRY_BASE_DELAY ? parseInt(process.env.MARKTOFLOW_RETRY_BASE_DELAY, 10) : 1000),
       retryMaxDelay: config.retryMaxDelay ?? (process.env.MARKTOFLOW_RETRY_MAX_DELAY ? parseInt(process.env.MARKTOFLOW_RETRY_MAX_DELAY, 10) : 30000),
+      maxConcurrency: config.maxConcurrency ?? (process.env.MARKTOFLOW_MAX_CONCURRENCY ? parseInt(process.env.MARKTOFLOW_MAX_CONCURRENCY, 10) : 1),
+      maxServiceConcurrency: config.maxServiceConcurrency ?? (process.env.MARKTOFLOW_MAX_SERVICE_CONCURRENCY ? parseInt(process.env.MARKTOFLOW_MAX_SERVICE_CONCURRENCY, 10) : Infinity),
       defaultAgent: config.defaultAgent,
       defaultModel: config.defaultModel,
     };
 
-    this.retryPolicy = new RetryPolicy(
-      this.config.maxRetries,
-      this.config.retryBaseDelay,
-      this.config.retryMaxDelay,
-    );
+    if (this.config.maxServiceConcurrency < 1) {
+      throw new Error(
+        `Invalid maxServiceConcurrency: ${this.config.maxServiceConcurrency} (must be at least 1)`
+      );
+    }
+
+    const { maxRetries, retryBaseDelay, retryMaxDelay } = this.config;
+    this.retryPolicy =
+      maxRetries === DEFAULT_RETRY_POLICY.maxRetries &&
+      retryBaseDelay === DEFAULT_RETRY_POLICY.baseDelay &&
+      retryMaxDelay === DEFAULT_RETRY_POLICY.maxDelay
+        ? DEFAULT_RETRY_POLICY
+        : new RetryPolicy(maxRetries, retryBaseDelay, retryMaxDelay);
 
     this.events = events;
     this.stateStore = stateStore;
@@ -174,9 +200,26 @@ export class WorkflowEngine {
   ): Promise<StepResult> {
     // Check conditions first (applies to all step types)
     if (step.conditions && !evaluateConditions(step.conditions, context)) {
-      return createStepResult(step.id, StepStatus.SKIPPED, null, new Date());
+      return createSkippedStepResult(step.id);
     }
 
+    return this.dispatchStep(step, context, sdkRegistry, stepExecutor);
+  }
+
+  /**
+   * Dispatch a step whose conditions have already been checked.
+   * The optional signal stops action steps from retrying once aborted.
+   * stepIndex overrides context.currentStepIndex in failover events, which
+   * concurrently running steps cannot rely on.
+   */
+  private async dispatchStep(
+    step: WorkflowStep,
+    context: ExecutionContext,
+    sdkRegistry: SDKRegistryLike,
+    stepExecutor: StepExecutor,
+    signal?: AbortSignal,
+    stepIndex?: number,
+  ): Promise<StepResult> {
     // Bind the dispatcher for recursive step execution
     const dispatch = (s: WorkflowStep, c: ExecutionContext, sr: SDKRegistryLike, se: StepExecutor) =>
       this.executeStep(s, c, sr, se);
@@ -236,7 +279,7 @@ export class WorkflowEngine {
     }
 
     // Default: action or workflow step
-    return this.executeStepWithFailover(step, context, sdkRegistry, stepExecutor);
+    return this.executeStepWithFailover(step, context, sdkRegistry, stepExecutor, signal, stepIndex);
   }
 
   // ============================================================================
@@ -293,62 +336,24 @@ export class WorkflowEngine {
     }
 
     try {
-      for (let i = 0; i < workflow.steps.length; i++) {
-        const step = workflow.steps[i];
-        context.currentStepIndex = i;
-
-        const result = await this.executeStep(step, context, sdkRegistry, stepExecutor);
-        stepResults.push(result);
-
-        // Store step metadata for condition evaluation
-        context.stepMetadata[step.id] = {
-          status: result.status.toLowerCase(),
-          retryCount: result.retryCount,
-          ...(result.error ? { error: errorToString(result.error) } : {}),
-        };
-
-        // Store output variable
-        if (step.outputVariable && result.status === StepStatus.COMPLETED) {
-          context.variables[step.outputVariable] = result.output;
-        }
-
-        // Check if this step set workflow outputs (from workflow.set_outputs action)
-        if (result.status === StepStatus.COMPLETED &&
-            result.output &&
-            typeof result.output === 'object' &&
-            '__workflow_outputs__' in result.output) {
-          const outputObj = result.output as Record<string, unknown>;
-          const outputs = outputObj['__workflow_outputs__'] as Record<string, unknown>;
-          context.workflowOutputs = outputs;
+      if (this.config.maxConcurrency > 1) {
+        const failure = await this.executeStepsConcurrently(
+          workflow, context, stepResults, sdkRegistry, stepExecutor,
+        );
+        if (failure) {
+          return await this.handleStepFailure(workflow, failure.step, failure.result, context, stepResults, startedAt);
         }
+      } else {
+        for (let i = 0; i < workflow.steps.length; i++) {
+          const step = workflow.steps[i];
+          context.currentStepIndex = i;
 
-        // Handle failure
-        if (result.status === StepStatus.FAILED) {
-          let errorAction = 'stop';
-          if ('errorHandling' in step && step.errorHandling?.action) {
-            errorAction = step.errorHandling.action;
-          }
+          const result = await this.executeStep(step, context, sdkRegistry, stepExecutor);
+          stepResults.push(result);
+          this.applyStepResult(step, result, context);
 
-          if (errorAction === 'stop') {
-            context.status = WorkflowStatus.FAILED;
-            const workflowError = result.error ? errorToString(result.error) : `Step ${step.id} failed`;
-            const workflowResult = this.buildWorkflowResult(workflow, context, stepResults, startedAt, workflowError);
-            this.events.onWorkflowComplete?.(workflow, workflowResult);
-            return workflowResult;
-          }
-          if (errorAction === 'rollback') {
-            if (this.rollbackRegistry) {
-              await this.rollbackRegistry.rollbackAllAsync({
-                context,
-                inputs: context.inputs,
-                variables: context.variables,
-              });
-            }
-            context.status = WorkflowStatus.FAILED;
-            const workflowError = result.error ? errorToString(result.error) : `Step ${step.id} failed`;
-            const workflowResult = this.buildWorkflowResult(workflow, context, stepResults, startedAt, workflowError);
-            this.events.onWorkflowComplete?.(workflow, workflowResult);
-            return workflowResult;
+          if (result.status === StepStatus.FAILED && getErrorAction(step) !== 'continue') {
+            return await this.handleStepFailure(workflow, step, result, context, stepResults, startedAt);
           }
         }
       }
@@ -357,19 +362,19 @@ export class WorkflowEngine {
     } catch (error) {
       context.status = WorkflowStatus.FAILED;
 
+      const workflowResult = this.buildWorkflowResult(
+        workflow, context, stepResults, startedAt,
+        error instanceof Error ? error.message : String(error),
+      );
+
       if (this.stateStore) {
         this.stateStore.updateExecution(context.runId, {
           status: WorkflowStatus.FAILED,
-          completedAt: new Date(),
+          completedAt: workflowResult.completedAt,
           error: error instanceof Error ? error.message : String(error),
         });
       }
 
-      const workflowResult = this.buildWorkflowResult(
-        workflow, context, stepResults, startedAt,
-        error instanceof Error ? error.message : String(error),
-      );
-
       this.events.onWorkflowComplete?.(workflow, workflowResult);
       return workflowResult;
     }
@@ -379,7 +384,7 @@ export class WorkflowEngine {
     if (this.stateStore) {
       this.stateStore.updateExecution(context.runId, {
         status: context.status,
-        completedAt: new Date(),
+        completedAt: workflowResult.completedAt,
         outputs: context.variables,
       });
     }
@@ -577,46 +582,10 @@ export class WorkflowEngine {
 
         const result = await this.executeStep(step, context, sdkRegistry, stepExecutor);
         stepResults.push(result);
+        this.applyStepResult(step, result, context);
 
-        context.stepMetadata[step.id] = {
-          status: result.status.toLowerCase(),
-          retryCount: result.retryCount,
-          ...(result.error ? { error: errorToString(result.error) } : {}),
-        };
-
-        if (step.outputVariable && result.status === StepStatus.COMPLETED) {
-          context.variables[step.outputVariable] = result.output;
-        }
-
-        if (result.status === StepStatus.COMPLETED &&
-            result.output &&
-            typeof result.output === 'object' &&
-            '__workflow_outputs__' in result.output) {
-          const outputObj = result.output as Record<string, unknown>;
-          const outputs = outputObj['__workflow_outputs__'] as Record<string, unknown>;
-          context.workflowOutputs = outputs;
-        }
-
-        if (result.status === StepStatus.FAILED) {
-          let errorAction = 'stop';
-          if ('errorHandling' in step && step.errorHandling?.action) {
-            errorAction = step.errorHandling.action;
-          }
-
-          if (errorAction === 'stop' || errorAction === 'rollback') {
-            if (errorAction === 'rollback' && this.rollbackRegistry) {
-              await this.rollbackRegistry.rollbackAllAsync({
-                context,
-                inputs: context.inputs,
-                variables: context.variables,
-              });
-            }
-            context.status = WorkflowStatus.FAILED;
-            const workflowError = result.error ? errorToString(result.error) : `Step ${step.id} failed`;
-            const workflowResult = this.buildWorkflowResult(workflow, context, stepResults, startedAt, workflowError);
-            this.events.onWorkflowComplete?.(workflow, workflowResult);
-            return workflowResult;
-          }
+        if (result.status === StepStatus.FAILED && getErrorAction(step) !== 'continue') {
+          return await this.handleStepFailure(workflow, step, result, context, stepResults, startedAt);
         }
       }
 
@@ -624,19 +593,19 @@ export class WorkflowEngine {
     } catch (error) {
       context.status = WorkflowStatus.FAILED;
 
+      const workflowResult = this.buildWorkflowResult(
+        workflow, context, stepResults, startedAt,
+        error instanceof Error ? error.message : String(error),
+      );
+
       if (this.stateStore) {
         this.stateStore.updateExecution(runId, {
           status: WorkflowStatus.FAILED,
-          completedAt: new Date(),
+          completedAt: workflowResult.completedAt,
           error: error instanceof Error ? error.message : String(error),
         });
       }
 
-      const workflowResult = this.buildWorkflowResult(
-        workflow, context, stepResults, startedAt,
-        error instanceof Error ? error.message : String(error),
-      );
-
       this.events.onWorkflowComplete?.(workflow, workflowResult);
       return workflowResult;
     }
@@ -646,7 +615,7 @@ export class WorkflowEngine {
     if (this.stateStore) {
       this.stateStore.updateExecution(runId, {
         status: context.status,
-        completedAt: new Date(),
+        completedAt: workflowResult.completedAt,
         outputs: context.variables,
       });
     }
@@ -673,26 +642,195 @@ export class WorkflowEngine {
     return [...this.failoverEvents];
   }
 
+  // ============================================================================
+  // Step Scheduling
+  // ============================================================================
+
+  /**
+   * Record a finished step's status, output variable and workflow outputs on the context.
+   */
+  private applyStepResult(step: WorkflowStep, result: StepResult, context: ExecutionContext): void {
+    // Store step metadata for condition evaluation
+    context.stepMetadata[step.id] = {
+      status: result.status.toLowerCase(),
+      retryCount: result.retryCount,
+      ...(result.error ? { error: errorToString(result.error) } : {}),
+    };
+
+    // Store output variable
+    if (step.outputVariable && result.status === StepStatus.COMPLETED) {
+      context.variables[step.outputVariable] = result.output;
+    }
+
+    // Check if this step set workflow outputs (from workflow.set_outputs action)
+    if (result.status === StepStatus.COMPLETED &&
+        result.output &&
+        typeof result.output === 'object' &&
+        '__workflow_outputs__' in result.output) {
+      const outputObj = result.output as Record<string, unknown>;
+      const outputs = outputObj['__workflow_outputs__'] as Record<string, unknown>;
+      context.workflowOutputs = outputs;
+    }
+  }
+
+  /**
+   * Finish a workflow whose step failed with a "stop" or "rollback" error action.
+   */
+  private async handleStepFailure(
+    workflow: Workflow,
+    step: WorkflowStep,
+    result: StepResult,
+    context: ExecutionContext,
+    stepResults: StepResult[],
+    startedAt: Date,
+  ): Promise<WorkflowResult> {
+    if (getErrorAction(step) === 'rollback' && this.rollbackRegistry) {
+      await this.rollbackRegistry.rollbackAllAsync({
+        context,
+        inputs: context.inputs,
+        variables: context.variables,
+      });
+    }
+    context.status = WorkflowStatus.FAILED;
+    const workflowError = result.error ? errorToString(result.error) : `Step ${step.id} failed`;
+    const workflowResult = this.buildWorkflowResult(workflow, context, stepResults, startedAt, workflowError);
+    this.events.onWorkflowComplete?.(workflow, workflowResult);
+    return workflowResult;
+  }
+
+  /**
+   * Run top-level steps as a dependency graph, starting each step as soon as
+   * the steps it depends on have finished, up to maxConcurrency at a time.
+   *
+   * Step results are appended to stepResults in workflow order. Once a step
+   * fails with a "stop" or "rollback" error action no further steps are
+   * started and steps already running stop retrying; they are awaited and
+   * the failure is returned.
+   */
+  private async executeStepsConcurrently(
+    workflow: Workflow,
+    context: ExecutionContext,
+    stepResults: StepResult[],
+    sdkRegistry: SDKRegistryLike,
+    stepExecutor: StepExecutor,
+  ): Promise<{ step: WorkflowStep; result: StepResult } | undefined> {
+    const steps = workflow.steps;
+    const { dependencies, dependents } = buildStepDag(steps);
+    const pendingDependencies = dependencies.map((deps) => deps.length);
+    const results: (StepResult | undefined)[] = new Array(steps.length);
+    const ready: number[] = [];
+    const running = new Map<number, Promise<void>>();
+    const abort = new AbortController();
+    let failure: { step: WorkflowStep; result: StepResult } | undefined;
+
+    for (let i = 0; i < steps.length; i++) {
+      if (pendingDependencies[i] === 0) ready.push(i);
+    }
+
+    const complete = (index: number, result: StepResult): void => {
+      const step = steps[index];
+      results[index] = result;
+      this.applyStepResult(step, result, context);
+
+      if (result.status === StepStatus.FAILED && getErrorAction(step) !== 'continue') {
+        failure ??= { step, result };
+        abort.abort();
+        return;
+      }
+
+      for (const dependent of dependents[index]) {
+        pendingDependencies[dependent]--;
+        if (pendingDependencies[dependent] === 0) ready.push(dependent);
+      }
+    };
+
+    const launch = (index: number): void => {
+      const step = steps[index];
+      context.currentStepIndex = index;
+
+      // Skipped steps complete inline so their dependents become ready in
+      // the same scheduling pass instead of after a promise round-trip
+      if (step.conditions && !evaluateConditions(step.conditions, context)) {
+        complete(index, createSkippedStepResult(step.id));
+        return;
+      }
+
+      const task = this.dispatchStep(step, context, sdkRegistry, stepExecutor, abort.signal, index).then((result) => {
+        running.delete(index);
+        complete(index, result);
+      });
+      running.set(index, task);
+    };
+
+    try {
+      // eslint-disable-next-line no-constant-condition
+      while (true) {
+        // Lower indices first keeps scheduling close to the written step order
+        ready.sort((a, b) => a - b);
+        while (!failure && ready.length > 0 && running.size < this.config.maxConcurrency) {
+          launch(ready.shift()!);
+        }
+        if (running.size === 0) break;
+        await Promise.race(running.values());
+      }
+    } catch (error) {
+      // Let in-flight steps settle before surfacing the error
+      abort.abort();
+      await Promise.allSettled(running.values());
+      throw error;
+    } finally {
+      for (const result of results) {
+        if (result) stepResults.push(result);
+      }
+    }
+
+    return failure;
+  }
+
   // ============================================================================
   // Step Execution with Retry & Failover
   // ============================================================================
 
   /**
    * Build the step executor context with effective model/agent/permissions.
+   *
+   * Cached per step so retries and repeated runs don't re-merge permissions
+   * and rebuild the security policy; the cache entry is reused only while
+   * the workflow-level permissions, defaults and path it was built from
+   * are unchanged.
    */
   private buildStepExecutorContext(step: WorkflowStep): StepExecutorContext {
+    const cached = this.executorContextCache.get(step);
+    if (
+      cached &&
+      cached.workflowPermissions === this.workflowPermissions &&
+      cached.defaultModel === this.config.defaultModel &&
+      cached.defaultAgent === this.config.defaultAgent &&
+      cached.context.basePath === this.workflowPath
+    ) {
+      return cached.context;
+    }
+
     const effectivePermissions = mergePermissions(
       this.workflowPermissions,
       step.permissions,
     );
 
-    return {
+    const context: StepExecutorContext = {
       model: step.model || this.config.defaultModel,
       agent: step.agent || this.config.defaultAgent,
       permissions: effectivePermissions,
       securityPolicy: toSecurityPolicy(effectivePermissions),
       basePath: this.workflowPath,
     };
+
+    this.executorContextCache.set(step, {
+      workflowPermissions: this.workflowPermissions,
+      defaultModel: this.config.defaultModel,
+      defaultAgent: this.config.defaultAgent,
+      context,
+    });
+    return context;
   }
 
   /**
@@ -749,12 +887,14 @@ export class WorkflowEngine {
 
   /**
    * Execute a step with retry logic.
+   * No further attempts are made once the optional signal is aborted.
    */
   private async executeStepWithRetry(
     step: WorkflowStep,
     context: ExecutionContext,
     sdkRegistry: SDKRegistryLike,
     stepExecutor: StepExecutor,
+    signal?: AbortSignal,
   ): Promise<StepResult> {
     const startedAt = new Date();
     let lastError: Error | undefined;
@@ -801,6 +941,8 @@ export class WorkflowEngine {
               maxRetries: this.config.maxRetries,
               retryBaseDelay: this.config.retryBaseDelay,
               retryMaxDelay: this.config.retryMaxDelay,
+              maxConcurrency: this.config.maxConcurrency,
+              maxServiceConcurrency: this.config.maxServiceConcurrency,
               failoverConfig: this.failoverConfig,
               healthTracker: this.healthTracker,
               ...(this.rollbackRegistry ? { rollbackRegistry: this.rollbackRegistry } : {}),
@@ -829,14 +971,21 @@ export class WorkflowEngine {
 
     const maxRetries = step.errorHandling?.maxRetries ?? this.config.maxRetries;
 
-    const [serviceName] = step.action.split('.');
+    const serviceName = getServiceName(step.action);
     let circuitBreaker = this.circuitBreakers.get(serviceName);
     if (!circuitBreaker) {
       circuitBreaker = new CircuitBreaker();
       this.circuitBreakers.set(serviceName, circuitBreaker);
     }
 
+    let retryCount = 0;
     for (let attempt = 0; attempt <= maxRetries; attempt++) {
+      // The workflow is stopping; give up instead of retrying
+      if (attempt > 0 && signal?.aborted) {
+        break;
+      }
+      retryCount = attempt;
+
       if (!circuitBreaker.canExecute()) {
         return createStepResult(
           step.id, StepStatus.FAILED, null, startedAt, attempt,
@@ -869,10 +1018,10 @@ export class WorkflowEngine {
         } else if (isBuiltInOperation(step.action)) {
           output = await executeBuiltInOperation(step.action, step.inputs, resolvedInputs, context);
         } else {
-          output = await this.executeWithTimeout(
+          output = await this.withServiceLimit(serviceName, () => this.executeWithTimeout(
             () => stepExecutor(stepWithResolvedInputs, context, sdkRegistry, executorContext),
             step.timeout ?? this.config.defaultTimeout,
-          );
+          ));
         }
 
         circuitBreaker.recordSuccess();
@@ -887,12 +1036,19 @@ export class WorkflowEngine {
 
         if (attempt < maxRetries) {
           const delay = this.retryPolicy.getDelay(attempt);
-          await sleep(delay);
+
+          // The breaker tripped and will still be open when the backoff ends,
+          // so the next attempt would be refused anyway; fail with the real error now
+          if (circuitBreaker.getState() === 'OPEN' && circuitBreaker.getRecoveryTimeout() > delay) {
+            break;
+          }
+
+          await sleep(delay, signal);
         }
       }
     }
 
-    const result = createStepResult(step.id, StepStatus.FAILED, null, startedAt, maxRetries, lastError);
+    const result = createStepResult(step.id, StepStatus.FAILED, null, startedAt, retryCount, lastError);
     this.events.onStepComplete?.(step, result);
     return result;
   }
@@ -905,10 +1061,12 @@ export class WorkflowEngine {
     context: ExecutionContext,
     sdkRegistry: SDKRegistryLike,
     stepExecutor: StepExecutor,
+    signal?: AbortSignal,
+    stepIndex: number = context.currentStepIndex,
   ): Promise<StepResult> {
-    const primaryResult = await this.executeStepWithRetry(step, context, sdkRegistry, stepExecutor);
+    const primaryResult = await this.executeStepWithRetry(step, context, sdkRegistry, stepExecutor, signal);
 
-    if (!isActionStep(step)) {
+    if (!isActionStep(step) || signal?.aborted) {
       return primaryResult;
     }
 
@@ -939,16 +1097,16 @@ export class WorkflowEngine {
     let attempts = 0;
     for (const fallbackTool of this.failoverConfig.fallbackAgents) {
       if (fallbackTool === primaryTool) continue;
-      if (attempts >= this.failoverConfig.maxFailoverAttempts) break;
+      if (attempts >= this.failoverConfig.maxFailoverAttempts || signal?.aborted) break;
 
       const fallbackStep: WorkflowStep = { ...step, action: `${fallbackTool}.${method}`, type: 'action' as const };
-      const result = await this.executeStepWithRetry(fallbackStep, context, sdkRegistry, stepExecutor);
+      const result = await this.executeStepWithRetry(fallbackStep, context, sdkRegistry, stepExecutor, signal);
       this.failoverEvents.push({
         timestamp: new Date(),
         fromAgent: primaryTool,
         toAgent: fallbackTool,
         reason: isTimeout ? FailoverReason.TIMEOUT : FailoverReason.STEP_EXECUTION_FAILED,
-        stepIndex: context.currentStepIndex,
+        stepIndex,
         error: errorMessage || undefined,
       });
       attempts += 1;
@@ -967,6 +1125,23 @@ export class WorkflowEngine {
   // Utility Methods
   // ============================================================================
 
+  /**
+   * Run an executor call within the per-service concurrency limit.
+   * Waiting for a slot does not count toward the step timeout.
+   */
+  private async withServiceLimit<T>(serviceName: string, fn: () => Promise<T>): Promise<T> {
+    if (!Number.isFinite(this.config.maxServiceConcurrency)) {
+      return fn();
+    }
+
+    let semaphore = this.serviceSemaphores.get(serviceName);
+    if (!semaphore) {
+      semaphore = new Semaphore(this.config.maxServiceConcurrency);
+      this.serviceSemaphores.set(serviceName, semaphore);
+    }
+    return semaphore.run(fn);
+  }
+
   /**
    * Execute a function with a timeout.
    * Uses a settled guard to prevent timer leaks and double-resolution.
@@ -1095,6 +1270,36 @@ export class WorkflowEngine {
 // Helpers
 // ============================================================================
 
-function sleep(ms: number): Promise<void> {
-  return new Promise((resolve) => setTimeout(resolve, ms));
+/**
+ * Service prefix of an action (e.g. "slack" for "slack.chat.postMessage").
+ */
+function getServiceName(action: string): string {
+  const dot = action.indexOf('.');
+  return dot === -1 ? action : action.slice(0, dot);
+}
+
+function getErrorAction(step: WorkflowStep): string {
+  if ('errorHandling' in step && step.errorHandling?.action) {
+    return step.errorHandling.action;
+  }
+  return 'stop';
+}
+
+function sleep(ms: number, signal?: AbortSignal): Promise<void> {
+  return new Promise((resolve) => {
+    if (signal?.aborted) {
+      resolve();
+      return;
+    }
+
+    const onAbort = (): void => {
+      clearTimeout(timer);
+      resolve();
+    };
+    const timer = setTimeout(() => {
+      signal?.removeEventListener('abort', onAbort);
+      resolve();
+    }, ms);
+    signal?.addEventListener('abort', onAbort, { once: true });
+  });
 }
@@ -8,6 +8,7 @@
 import type { ExecutionContext } from '../models.js';
 import { resolveVariablePath } from './variable-resolution.js';
 import { renderTemplate } from '../template-engine.js';
+import { BoundedCache } from '../utils/bounded-cache.js';
 
 /**
  * Evaluate multiple conditions (AND logic - all must be true).
@@ -21,6 +22,28 @@ export function evaluateConditions(conditions: string[], context: ExecutionConte
   return true;
 }
 
+/**
+ * A condition operand, resolved against the context at evaluation time.
+ */
+type ConditionOperand =
+  | { kind: 'template'; template: string }
+  | { kind: 'literal'; value: unknown }
+  | { kind: 'path'; path: string };
+
+/**
+ * A condition string split into its operator and operands once.
+ * A null operator means the left operand is checked for truthiness.
+ */
+interface CompiledCondition {
+  operator: string | null;
+  left: ConditionOperand;
+  right: unknown;
+}
+
+const CONDITION_OPERATORS = ['==', '!=', '>=', '<=', '>', '<'];
+
+const conditionCache = new BoundedCache<string, CompiledCondition>(1000);
+
 /**
  * Evaluate a single condition.
  * Supports: ==, !=, >, <, >=, <=
@@ -28,29 +51,12 @@ export function evaluateConditions(conditions: string[], context: ExecutionConte
  * and step status checks (e.g., step_id.status == 'failed')
  */
 export function evaluateCondition(condition: string, context: ExecutionContext): boolean {
-  // Simple expression parsing
-  const operators = ['==', '!=', '>=', '<=', '>', '<'];
-  let operator: string | undefined;
-  let parts: string[] = [];
-
-  for (const op of operators) {
-    if (condition.includes(op)) {
-      operator = op;
-      parts = condition.split(op).map((s) => s.trim());
-      break;
-    }
-  }
-
-  if (!operator || parts.length !== 2) {
-    // Treat as boolean variable reference with nested property support
-    const value = resolveConditionValue(parts[0] || condition, context);
-    return Boolean(value);
-  }
-
-  const left = resolveConditionValue(parts[0], context);
-  const right = parseValue(parts[1]);
+  const { operator, left: leftOperand, right } = compileCondition(condition);
+  const left = resolveOperand(leftOperand, context);
 
   switch (operator) {
+    case null:
+      return Boolean(left);
     case '==':
       return left == right;
     case '!=':
@@ -69,19 +75,39 @@ export function evaluateCondition(condition: string, context: ExecutionContext):
 }
 
 /**
- * Resolve a condition value with support for nested properties.
- * Handles direct variable references and nested paths.
- * Uses Nunjucks for template expressions with filters/regex.
+ * Parse a condition string, reusing the result for conditions seen before.
+ * Loops and repeated runs evaluate the same conditions many times.
  */
-export function resolveConditionValue(path: string, context: ExecutionContext): unknown {
+function compileCondition(condition: string): CompiledCondition {
+  return conditionCache.getOrCreate(condition, parseCondition);
+}
+
+function parseCondition(condition: string): CompiledCondition {
+  // Simple expression parsing
+  let operator: string | undefined;
+  let parts: string[] = [];
+
+  for (const op of CONDITION_OPERATORS) {
+    if (condition.includes(op)) {
+      operator = op;
+      parts = condition.split(op).map((s) => s.trim());
+      break;
+    }
+  }
+
+  return !operator || parts.length !== 2
+    ? // Treat as boolean variable reference with nested property support
+      { operator: null, left: compileOperand(parts[0] || condition), right: undefined }
+    : { operator, left: compileOperand(parts[0]), right: parseValue(parts[1]) };
+}
+
+/**
+ * Classify a condition operand as a template expression, literal or variable path.
+ */
+function compileOperand(path: string): ConditionOperand {
   // If it looks like a template expression, resolve it
   if (path.includes('|') || path.includes('=~') || path.includes('!~')) {
-    // Build template context
-    const templateContext: Record<string, unknown> = {
-      inputs: context.inputs,
-      ...context.variables,
-    };
-    return renderTemplate(`{{ ${path} }}`, templateContext);
+    return { kind: 'template', template: `{{ ${path} }}` };
   }
 
   // First try to parse as a literal value (true, false, numbers, etc.)
@@ -89,12 +115,40 @@ export function resolveConditionValue(path: string, context: ExecutionContext):
 
   // If parseValue returned the same string, try to resolve as a variable
   if (parsedValue === path) {
-    const resolved = resolveVariablePath(path, context);
-    return resolved;
+    return { kind: 'path', path };
   }
 
   // Return the parsed literal value
-  return parsedValue;
+  return { kind: 'literal', value: parsedValue };
+}
+
+/**
+ * Resolve a compiled operand against the execution context.
+ */
+function resolveOperand(operand: ConditionOperand, context: ExecutionContext): unknown {
+  switch (operand.kind) {
+    case 'template': {
+      // Build template context
+      const templateContext: Record<string, unknown> = {
+        inputs: context.inputs,
+        ...context.variables,
+      };
+      return renderTemplate(operand.template, templateContext);
+    }
+    case 'path':
+      return resolveVariablePath(operand.path, context);
+    case 'literal':
+      return operand.value;
+  }
+}
+
+/**
+ * Resolve a condition value with support for nested properties.
+ * Handles direct variable references and nested paths.
+ * Uses Nunjucks for template expressions with filters/regex.
+ */
+export function resolveConditionValue(path: string, context: ExecutionContext): unknown {
+  return resolveOperand(compileOperand(path), context);
 }
 
 /**
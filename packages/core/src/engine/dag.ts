@@ -0,0 +1,106 @@
+/**
+ * Step dependency analysis for marktoflow workflow engine.
+ *
+ * Builds a dependency graph over top-level workflow steps so that steps
+ * without data dependencies can be scheduled concurrently.
+ */
+
+import { type WorkflowStep, isActionStep } from '../models.js';
+import { isFileOperation } from '../file-operations.js';
+import { isEventOperation } from '../event-operations.js';
+
+export interface StepDag {
+  /** For each step index, the indices of earlier steps it must wait for */
+  dependencies: number[][];
+  /** For each step index, the indices of later steps waiting on it */
+  dependents: number[][];
+}
+
+const NAME_CHAR = /[A-Za-z0-9_]/;
+
+/**
+ * Whether a step must run on its own, ordered against every other step.
+ *
+ * Control-flow, wait and sub-workflow steps read and write the shared
+ * context directly, and workflow.* actions (e.g. workflow.set_outputs)
+ * change workflow-level state, so none of them are reordered. Steps with
+ * an external prompt file are rendered against every context variable,
+ * and the file's contents are not visible here, so they are ordered too.
+ * Built-in file and event operations act on shared external state (a
+ * file.write followed by a file.read of the same path), so they keep
+ * their written order. Other side-effect-only dependencies, such as
+ * create-then-update calls to the same service, are not detected.
+ */
+export function isBarrierStep(step: WorkflowStep): boolean {
+  if (!isActionStep(step)) {
+    return true;
+  }
+  return (
+    step.action.startsWith('workflow.') ||
+    isFileOperation(step.action) ||
+    isEventOperation(step.action) ||
+    step.prompt !== undefined
+  );
+}
+
+/**
+ * Whether a step's serialized definition mentions a name (step id or
+ * variable) anywhere: templates, conditions, prompt inputs.
+ *
+ * The whole name is matched, so ids such as `fetch-user` are found, and
+ * only letters, digits and `_` count as a boundary. That over-approximates
+ * (`fetch` also matches inside `fetch-user`), which can only add
+ * dependencies. Reads from an external prompt file are not covered;
+ * isBarrierStep orders those steps instead.
+ */
+function mentions(text: string, name: string): boolean {
+  if (name === '') {
+    return false;
+  }
+  for (let at = text.indexOf(name); at !== -1; at = text.indexOf(name, at + 1)) {
+    const before = text[at - 1];
+    const after = text[at + name.length];
+    if (
+      (before === undefined || !NAME_CHAR.test(before)) &&
+      (after === undefined || !NAME_CHAR.test(after))
+    ) {
+      return true;
+    }
+  }
+  return false;
+}
+
+/**
+ * Build the dependency graph for a list of steps.
+ *
+ * Step B depends on an earlier step A when either is a barrier, when B
+ * mentions A's output variable or step id (for `A.status` style checks),
+ * or when B writes a variable that A reads or writes.
+ */
+export function buildStepDag(steps: WorkflowStep[]): StepDag {
+  const dependencies: number[][] = steps.map(() => []);
+  const dependents: number[][] = steps.map(() => []);
+  const texts = steps.map((step) => JSON.stringify(step));
+  const barriers = steps.map(isBarrierStep);
+
+  for (let i = 0; i < steps.length; i++) {
+    const writes = steps[i].outputVariable;
+
+    for (let j = 0; j < i; j++) {
+      const earlier = steps[j];
+      const dependsOnEarlier =
+        barriers[i] ||
+        barriers[j] ||
+        mentions(texts[i], earlier.id) ||
+        (earlier.outputVariable !== undefined && mentions(texts[i], earlier.outputVariable)) ||
+        (writes !== undefined && (mentions(texts[j], writes) || earlier.outputVariable === writes));
+
+      if (dependsOnEarlier) {
+        dependencies[i].push(j);
+        dependents[j].push(i);
+      }
+    }
+  }
+
+  return { dependencies, dependents };
+}
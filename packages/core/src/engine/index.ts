@@ -7,6 +7,8 @@
 export { evaluateConditions, evaluateCondition, resolveConditionValue, parseValue } from './conditions.js';
 export { resolveTemplates, resolveVariablePath, getNestedValue } from './variable-resolution.js';
 export { RetryPolicy, CircuitBreaker, type CircuitState } from './retry.js';
+export { buildStepDag, isBarrierStep, type StepDag } from './dag.js';
+export { Semaphore } from './semaphore.js';
 export {
   executeIfStep,
   executeSwitchStep,
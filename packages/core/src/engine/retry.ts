@@ -9,26 +9,50 @@
 // Retry Policy
 // ============================================================================
 
+/** Attempts beyond this are computed on demand rather than precomputed */
+const MAX_PRECOMPUTED_ATTEMPTS = 64;
+
+/**
+ * Exponential backoff with jitter. The random source is injectable so
+ * jittered delays can be reproduced in tests.
+ */
 export class RetryPolicy {
+  /** Clamped backoff delay per attempt, before jitter */
+  private readonly delays: number[];
+
   constructor(
     public readonly maxRetries: number = 3,
     public readonly baseDelay: number = 1000,
     public readonly maxDelay: number = 30000,
     public readonly exponentialBase: number = 2,
-    public readonly jitter: number = 0.1
-  ) {}
+    public readonly jitter: number = 0.1,
+    private readonly random: () => number = () => Math.random()
+  ) {
+    this.delays = [];
+    const lastAttempt = Math.min(maxRetries, MAX_PRECOMPUTED_ATTEMPTS);
+    for (let attempt = 0; attempt <= lastAttempt; attempt++) {
+      this.delays.push(this.computeDelay(attempt));
+    }
+  }
 
   /**
    * Calculate delay for a given retry attempt.
    */
   getDelay(attempt: number): number {
-    const exponentialDelay = this.baseDelay * Math.pow(this.exponentialBase, attempt);
-    const clampedDelay = Math.min(exponentialDelay, this.maxDelay);
+    const clampedDelay = this.delays[attempt] ?? this.computeDelay(attempt);
+    if (this.jitter === 0) {
+      return clampedDelay;
+    }
 
     // Add jitter
-    const jitterAmount = clampedDelay * this.jitter * (Math.random() * 2 - 1);
+    const jitterAmount = clampedDelay * this.jitter * (this.random() * 2 - 1);
     return Math.max(0, clampedDelay + jitterAmount);
   }
+
+  private computeDelay(attempt: number): number {
+    const exponentialDelay = this.baseDelay * Math.pow(this.exponentialBase, attempt);
+    return Math.min(exponentialDelay, this.maxDelay);
+  }
 }
 
 // ============================================================================
@@ -37,17 +61,36 @@ export class RetryPolicy {
 
 export type CircuitState = 'CLOSED' | 'OPEN' | 'HALF_OPEN';
 
+/**
+ * Circuit breaker with exponential recovery backoff.
+ *
+ * The first open waits recoveryTimeout before allowing a half-open probe.
+ * Each time the circuit re-opens without closing in between, the wait
+ * doubles, up to maxRecoveryTimeout. A success that closes the circuit
+ * resets the backoff.
+ *
+ * Timing is read from the injectable clock (milliseconds), which lets
+ * tests advance time without sleeping. The default is the monotonic
+ * performance.now(), so wall-clock adjustments cannot shorten or stretch
+ * a recovery window.
+ */
 export class CircuitBreaker {
   private state: CircuitState = 'CLOSED';
   private failures = 0;
   private lastFailureTime = 0;
   private halfOpenCalls = 0;
+  private consecutiveOpens = 0;
+  private currentRecoveryTimeout: number;
 
   constructor(
     public readonly failureThreshold: number = 5,
     public readonly recoveryTimeout: number = 30000,
-    public readonly halfOpenMaxCalls: number = 3
-  ) {}
+    public readonly halfOpenMaxCalls: number = 3,
+    public readonly maxRecoveryTimeout: number = 300000,
+    private readonly clock: () => number = () => performance.now()
+  ) {
+    this.currentRecoveryTimeout = recoveryTimeout;
+  }
 
   canExecute(): boolean {
     if (this.state === 'CLOSED') {
@@ -55,32 +98,39 @@ export class CircuitBreaker {
     }
 
     if (this.state === 'OPEN') {
-      const timeSinceFailure = Date.now() - this.lastFailureTime;
-      if (timeSinceFailure >= this.recoveryTimeout) {
+      const timeSinceFailure = this.clock() - this.lastFailureTime;
+      if (timeSinceFailure >= this.currentRecoveryTimeout) {
+        // This call is the first half-open probe
         this.state = 'HALF_OPEN';
-        this.halfOpenCalls = 0;
+        this.halfOpenCalls = 1;
         return true;
       }
       return false;
     }
 
     // HALF_OPEN
-    return this.halfOpenCalls < this.halfOpenMaxCalls;
+    if (this.halfOpenCalls < this.halfOpenMaxCalls) {
+      this.halfOpenCalls++;
+      return true;
+    }
+    return false;
   }
 
   recordSuccess(): void {
     this.failures = 0;
     this.state = 'CLOSED';
+    this.consecutiveOpens = 0;
+    this.currentRecoveryTimeout = this.recoveryTimeout;
   }
 
   recordFailure(): void {
     this.failures++;
-    this.lastFailureTime = Date.now();
+    this.lastFailureTime = this.clock();
 
     if (this.state === 'HALF_OPEN') {
-      this.state = 'OPEN';
-    } else if (this.failures >= this.failureThreshold) {
-      this.state = 'OPEN';
+      this.open();
+    } else if (this.state === 'CLOSED' && this.failures >= this.failureThreshold) {
+      this.open();
     }
   }
 
@@ -88,9 +138,28 @@ export class CircuitBreaker {
     return this.state;
   }
 
+  /**
+   * Current wait before the next half-open probe.
+   */
+  getRecoveryTimeout(): number {
+    return this.currentRecoveryTimeout;
+  }
+
   reset(): void {
     this.state = 'CLOSED';
     this.failures = 0;
     this.halfOpenCalls = 0;
+    this.consecutiveOpens = 0;
+    this.currentRecoveryTimeout = this.recoveryTimeout;
+  }
+
+  private open(): void {
+    const backoff = this.recoveryTimeout * Math.pow(2, this.consecutiveOpens);
+    this.currentRecoveryTimeout = Math.max(
+      this.recoveryTimeout,
+      Math.min(backoff, this.maxRecoveryTimeout)
+    );
+    this.consecutiveOpens++;
+    this.state = 'OPEN';
   }
 }
@@ -0,0 +1,58 @@
+/**
+ * Counting semaphore for marktoflow workflow engine.
+ *
+ * Bounds how many calls to the same service run at once when steps
+ * execute concurrently.
+ */
+
+export class Semaphore {
+  private active = 0;
+  private waiters: Array<() => void> = [];
+
+  constructor(public readonly limit: number) {
+    if (!(limit >= 1)) {
+      throw new Error(`Semaphore limit must be at least 1, got ${limit}`);
+    }
+  }
+
+  /**
+   * Run fn once a slot is free, releasing the slot when it settles.
+   * Waiters are served in FIFO order.
+   */
+  async run<T>(fn: () => Promise<T>): Promise<T> {
+    await this.acquire();
+    try {
+      return await fn();
+    } finally {
+      this.release();
+    }
+  }
+
+  /** Number of calls currently holding a slot */
+  get inFlight(): number {
+    return this.active;
+  }
+
+  /** Number of calls waiting for a slot */
+  get pending(): number {
+    return this.waiters.length;
+  }
+
+  private acquire(): Promise<void> {
+    if (this.active < this.limit) {
+      this.active++;
+      return Promise.resolve();
+    }
+    return new Promise((resolve) => this.waiters.push(resolve));
+  }
+
+  private release(): void {
+    const next = this.waiters.shift();
+    if (next) {
+      // Hand the slot straight to the next waiter
+      next();
+    } else {
+      this.active--;
+    }
+  }
+}
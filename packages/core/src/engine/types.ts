@@ -17,6 +17,15 @@ export interface EngineConfig {
   retryBaseDelay?: number;
   /** Maximum delay for retry backoff in milliseconds */
   retryMaxDelay?: number;
+  /**
+   * Maximum number of independent top-level steps run at once (default: 1, sequential).
+   * Steps are ordered by template and output-variable references only;
+   * steps that depend on each other purely through side effects (e.g.
+   * create-then-update calls to the same service) may be reordered.
+   */
+  maxConcurrency?: number;
+  /** Maximum concurrent executor calls per service, e.g. per tool or agent (default: unlimited) */
+  maxServiceConcurrency?: number;
   /** Optional rollback registry for rollback error handling */
   rollbackRegistry?: RollbackRegistry;
   /** Failover configuration for step execution */
@@ -8,6 +8,9 @@
 import type { ExecutionContext } from '../models.js';
 import { renderTemplate } from '../template-engine.js';
 
+/** Opening of a Nunjucks variable, tag or comment: {{, {% or {# */
+const TEMPLATE_MARKER = /\{[{%#]/;
+
 /**
  * Resolve template variables in a value.
  * Supports {{variable}}, {{inputs.name}}, and Nunjucks filters.
@@ -16,35 +19,48 @@ import { renderTemplate } from '../template-engine.js';
  * - Legacy regex operator support (=~, !~, //) converted to filters
  * - Custom filters for string, array, object, date operations
  * - Jinja2-style control flow ({% for %}, {% if %}, etc.)
+ *
+ * Strings without template markup are returned as-is, and the template
+ * context is built at most once per call rather than once per string.
  */
 export function resolveTemplates(value: unknown, context: ExecutionContext): unknown {
-  if (typeof value === 'string') {
-    // Build the template context with all available variables
-    // Spread inputs first, then variables (variables override inputs if same key)
-    // Also keep inputs accessible via inputs.* for explicit access
-    const templateContext: Record<string, unknown> = {
-      ...context.inputs, // Spread inputs at root level for direct access ({{ path }})
-      ...context.variables, // Variables override inputs if same key
-      inputs: context.inputs, // Also keep inputs accessible as inputs.*
-    };
-
-    // Use the new Nunjucks-based template engine with legacy syntax support
-    return renderTemplate(value, templateContext);
-  }
+  let templateContext: Record<string, unknown> | undefined;
 
-  if (Array.isArray(value)) {
-    return value.map((v) => resolveTemplates(v, context));
-  }
+  const resolve = (current: unknown): unknown => {
+    if (typeof current === 'string') {
+      if (!TEMPLATE_MARKER.test(current)) {
+        return current;
+      }
 
-  if (value && typeof value === 'object') {
-    const result: Record<string, unknown> = {};
-    for (const [k, v] of Object.entries(value)) {
-      result[k] = resolveTemplates(v, context);
+      // Build the template context with all available variables
+      // Spread inputs first, then variables (variables override inputs if same key)
+      // Also keep inputs accessible via inputs.* for explicit access
+      templateContext ??= {
+        ...context.inputs, // Spread inputs at root level for direct access ({{ path }})
+        ...context.variables, // Variables override inputs if same key
+        inputs: context.inputs, // Also keep inputs accessible as inputs.*
+      };
+
+      // Use the new Nunjucks-based template engine with legacy syntax support
+      return renderTemplate(current, templateContext);
     }
-    return result;
-  }
 
-  return value;
+    if (Array.isArray(current)) {
+      return current.map(resolve);
+    }
+
+    if (current && typeof current === 'object') {
+      const result: Record<string, unknown> = {};
+      for (const [k, v] of Object.entries(current)) {
+        result[k] = resolve(v);
+      }
+      return result;
+    }
+
+    return current;
+  };
+
+  return resolve(value);
 }
 
 /**
@@ -207,6 +207,15 @@ const PINO_LEVELS: Record<LogLevel, string> = {
   [LogLevel.CRITICAL]: 'fatal',
 };
 
+/**
+ * Stdout destination for run loggers.
+ * The async sink buffers log lines and writes them off the calling path, so
+ * per-step logging does not block on stdout; Pino flushes it on process exit.
+ */
+function createStdoutDestination(sync: boolean): DestinationStream {
+  return pino.destination({ dest: 1, sync });
+}
+
 export interface ExecutionLoggerOptions {
   /** Directory for markdown log files */
   logsDir?: string;
@@ -214,6 +223,8 @@ export interface ExecutionLoggerOptions {
   jsonLogs?: boolean;
   /** Custom Pino destination stream */
   destination?: DestinationStream;
+  /** Write to stdout synchronously instead of through Pino's async sink (default: false) */
+  sync?: boolean;
   /** Minimum log level (default: 'debug') */
   level?: LogLevel;
 }
@@ -230,13 +241,13 @@ export class ExecutionLogger {
     if (typeof options === 'string') {
       this.logsDir = options;
       this.jsonLogs = false;
-      this.baseLogger = pino({ level: 'debug' });
+      this.baseLogger = pino({ level: 'debug' }, createStdoutDestination(false));
     } else {
       this.logsDir = options.logsDir ?? '.marktoflow/state/execution-logs';
       this.jsonLogs = options.jsonLogs ?? false;
       this.baseLogger = pino(
         { level: PINO_LEVELS[options.level ?? LogLevel.DEBUG] },
-        options.destination
+        options.destination ?? createStdoutDestination(options.sync ?? false)
       );
     }
   }
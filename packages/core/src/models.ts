@@ -587,3 +587,21 @@ export function createStepResult(
     retryCount,
   };
 }
+
+/**
+ * Result for a step whose conditions were not met. It never ran, so it
+ * starts and completes at the same instant.
+ */
+export function createSkippedStepResult(stepId: string): StepResult {
+  const now = new Date();
+  return {
+    stepId,
+    status: StepStatus.SKIPPED,
+    output: null,
+    error: undefined,
+    startedAt: now,
+    completedAt: now,
+    duration: 0,
+    retryCount: 0,
+  };
+}
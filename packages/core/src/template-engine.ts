@@ -16,6 +16,7 @@
 
 import nunjucks from 'nunjucks';
 import { registerFilters } from './nunjucks-filters.js';
+import { BoundedCache } from './utils/bounded-cache.js';
 
 // ============================================================================
 // Environment Setup
@@ -32,6 +33,42 @@ const env = new nunjucks.Environment(null, {
 // Register all custom filters
 registerFilters(env);
 
+// ============================================================================
+// Compiled Template Cache
+// ============================================================================
+
+/**
+ * A template string, classified and compiled once.
+ * - path: a single {{ a.b[0] }} reference, resolved by direct lookup
+ * - expression: a single {{ expr }} evaluated through Nunjucks to keep its type
+ * - render: anything else, rendered to a string
+ */
+type CompiledTemplate =
+  | { kind: 'path'; parts: string[] }
+  | { kind: 'expression'; json: nunjucks.Template; direct: nunjucks.Template }
+  | { kind: 'render'; template: nunjucks.Template };
+
+/**
+ * Templates longer than this (e.g. whole prompt files) are compiled per
+ * render and never cached, so the cache's memory stays bounded.
+ */
+const TEMPLATE_CACHE_MAX_LENGTH = 4096;
+
+const templateCache = new BoundedCache<string, CompiledTemplate>(1000);
+
+/**
+ * Get the compiled form of a template, compiling it on first use.
+ * Workflows render the same input strings on every run and retry, so
+ * parsing each one once avoids re-running the Nunjucks lexer and compiler.
+ */
+function compileTemplate(template: string): CompiledTemplate {
+  if (template.length > TEMPLATE_CACHE_MAX_LENGTH) {
+    return classifyTemplate(template);
+  }
+
+  return templateCache.getOrCreate(template, classifyTemplate);
+}
+
 // ============================================================================
 // Template Resolution
 // ============================================================================
@@ -70,6 +107,35 @@ export function renderTemplate(
   template: string,
   context: Record<string, unknown>
 ): unknown {
+  const compiled = compileTemplate(template);
+
+  if (compiled.kind !== 'render') {
+    // Single expression - return the actual value (could be object, array, etc.)
+    return evaluateExpression(compiled, context);
+  }
+
+  // String with multiple expressions, control flow, or plain text - render as string
+  try {
+    return compiled.template.render(context);
+  } catch (error) {
+    // If rendering fails, return the original template.
+    // Undefined/falsey variable access is expected when previewing workflows
+    // without inputs — log as debug, not error.
+    if (error instanceof Error && /undefined or falsey/.test(error.message)) {
+      // Silently return original template for undefined variable access
+      return template;
+    }
+    console.warn('Template render warning:', error instanceof Error ? error.message : error);
+    return template;
+  }
+}
+
+/**
+ * Decide how a template string is evaluated and compile it accordingly.
+ * Nunjucks templates compile lazily on first render, so syntax errors
+ * still surface inside the render/evaluate error handling.
+ */
+function classifyTemplate(template: string): CompiledTemplate {
   // Check if the entire string is a single template expression
   // Handle nested braces in object literals like {{ foo | merge({a: 1}) }}
   const trimmed = template.trim();
@@ -96,58 +162,60 @@ export function renderTemplate(
     }
 
     if (!hasUnbalancedTemplates && braceCount === 0) {
-      // Single expression - return the actual value (could be object, array, etc.)
-      const expression = inner.trim();
-      return evaluateExpression(expression, context);
+      return compileExpression(inner.trim());
     }
   }
 
-  // String with multiple expressions, control flow, or plain text - render as string
-  try {
-    return env.renderString(template, context);
-  } catch (error) {
-    // If rendering fails, return the original template.
-    // Undefined/falsey variable access is expected when previewing workflows
-    // without inputs — log as debug, not error.
-    if (error instanceof Error && /undefined or falsey/.test(error.message)) {
-      // Silently return original template for undefined variable access
-      return template;
-    }
-    console.warn('Template render warning:', error instanceof Error ? error.message : error);
-    return template;
-  }
+  return { kind: 'render', template: new nunjucks.Template(template, env) };
 }
 
 /**
- * Evaluate a single expression and return its value.
- * This is used for single {{expr}} templates where we want to preserve
- * the actual type (object, array, number, etc.) instead of stringifying.
+ * Compile a single expression.
  *
  * IMPORTANT: Never use new Function() or eval() - they allow arbitrary code execution.
  * Always use Nunjucks for evaluation to maintain the security sandbox.
  */
-function evaluateExpression(expression: string, context: Record<string, unknown>): unknown {
-  try {
-    // For simple variable references (no filters or operators), use direct lookup
-    // This preserves object/array types that Nunjucks would stringify
-    const simpleVarMatch = expression.match(
-      /^([a-zA-Z_][a-zA-Z0-9_]*)(\.[a-zA-Z_][a-zA-Z0-9_]*|\[\d+\]|\['[^']+'\]|\["[^"]+"\])*$/
-    );
+function compileExpression(expression: string): CompiledTemplate {
+  // For simple variable references (no filters or operators), use direct lookup
+  // This preserves object/array types that Nunjucks would stringify
+  const simpleVarMatch = expression.match(
+    /^([a-zA-Z_][a-zA-Z0-9_]*)(\.[a-zA-Z_][a-zA-Z0-9_]*|\[\d+\]|\['[^']+'\]|\["[^"]+"\])*$/
+  );
+
+  if (simpleVarMatch && !expression.includes('|')) {
+    return { kind: 'path', parts: parseVariablePath(expression) };
+  }
+
+  // All other expressions (including arithmetic) go through Nunjucks for safe evaluation
+  // Nunjucks provides proper expression evaluation without arbitrary code execution
+  // Use JSON serialization to preserve the actual type (object, array, number, etc.)
+  // Note: Parentheses around expression are critical for operator precedence.
+  // Without them, filters bind tighter than operators: {{ x + y | filter }} === {{ x + (y | filter) }}
+  // With parentheses: {{ (x + y) | filter }} evaluates the full expression first.
+  return {
+    kind: 'expression',
+    json: new nunjucks.Template(`{{ (${expression}) | to_json }}`, env),
+    direct: new nunjucks.Template(`{{ ${expression} }}`, env),
+  };
+}
 
-    if (simpleVarMatch && !expression.includes('|')) {
+/**
+ * Evaluate a compiled single expression and return its value.
+ * This is used for single {{expr}} templates where we want to preserve
+ * the actual type (object, array, number, etc.) instead of stringifying.
+ */
+function evaluateExpression(
+  compiled: Exclude<CompiledTemplate, { kind: 'render' }>,
+  context: Record<string, unknown>
+): unknown {
+  try {
+    if (compiled.kind === 'path') {
       // Simple variable path - resolve directly for better type preservation
-      const result = resolveVariablePath(expression, context);
+      const result = getPathValue(compiled.parts, context);
       return result !== undefined ? result : '';
     }
 
-    // All other expressions (including arithmetic) go through Nunjucks for safe evaluation
-    // Nunjucks provides proper expression evaluation without arbitrary code execution
-    // Use JSON serialization to preserve the actual type (object, array, number, etc.)
-    // Note: Parentheses around expression are critical for operator precedence.
-    // Without them, filters bind tighter than operators: {{ x + y | filter }} === {{ x + (y | filter) }}
-    // With parentheses: {{ (x + y) | filter }} evaluates the full expression first.
-    const wrappedTemplate = `{{ (${expression}) | to_json }}`;
-    const jsonResult = env.renderString(wrappedTemplate, context);
+    const jsonResult = compiled.json.render(context);
 
     // Parse JSON to get the actual type
     try {
@@ -156,7 +224,7 @@ function evaluateExpression(expression: string, context: Record<string, unknown>
     } catch {
       // Not valid JSON (e.g., undefined, function result)
       // Try direct rendering and return the string result
-      const directResult = env.renderString(`{{ ${expression} }}`, context);
+      const directResult = compiled.direct.render(context);
       return directResult || '';
     }
   } catch (error) {
@@ -171,10 +239,10 @@ function evaluateExpression(expression: string, context: Record<string, unknown>
 }
 
 /**
- * Resolve a variable path from context (supports dot notation and array indexing).
+ * Split a variable path into its parts (supports dot notation and array indexing).
  * Example: "user.name", "items[0].id", "data['key']"
  */
-function resolveVariablePath(path: string, context: Record<string, unknown>): unknown {
+function parseVariablePath(path: string): string[] {
   const parts: string[] = [];
   let current = '';
   let inQuote: string | null = null;
@@ -222,7 +290,13 @@ function resolveVariablePath(path: string, context: Record<string, unknown>): un
     parts.push(current);
   }
 
-  // Traverse the object
+  return parts;
+}
+
+/**
+ * Look up a parsed variable path in the context.
+ */
+function getPathValue(parts: string[], context: Record<string, unknown>): unknown {
   let result: unknown = context;
 
   for (const part of parts) {
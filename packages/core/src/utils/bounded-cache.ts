@@ -0,0 +1,41 @@
+/**
+ * Bounded cache utility for marktoflow.
+ *
+ * Keeps compiled forms of strings (templates, conditions) that workflows
+ * evaluate repeatedly, without letting the cache grow without limit.
+ */
+
+/**
+ * A Map capped at a fixed number of entries.
+ * Once full, the oldest inserted entry is evicted first.
+ */
+export class BoundedCache<K, V> {
+  private readonly entries = new Map<K, V>();
+
+  constructor(public readonly limit: number) {}
+
+  /**
+   * Get the cached value for key, creating and caching it on first use.
+   *
+   * @param key - Cache key
+   * @param create - Builds the value when the key is not cached
+   * @returns The cached or newly created value
+   */
+  getOrCreate(key: K, create: (key: K) => V): V {
+    if (this.entries.has(key)) {
+      return this.entries.get(key) as V;
+    }
+
+    const value = create(key);
+    if (this.entries.size >= this.limit) {
+      this.entries.delete(this.entries.keys().next().value as K);
+    }
+    this.entries.set(key, value);
+    return value;
+  }
+
+  /** Number of cached entries */
+  get size(): number {
+    return this.entries.size;
+  }
+}
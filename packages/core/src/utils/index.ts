@@ -1,2 +1,3 @@
 export { parseDuration } from './duration.js';
 export { errorToString, toError } from './errors.js';
+export { BoundedCache } from './bounded-cache.js';
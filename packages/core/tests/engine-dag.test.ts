@@ -0,0 +1,299 @@
+/**
+ * Tests for dependency-aware concurrent step scheduling.
+ */
+
+import { describe, it, expect, vi } from 'vitest';
+import { WorkflowEngine } from '../src/engine.js';
+import { buildStepDag } from '../src/engine/dag.js';
+import { Semaphore } from '../src/engine/semaphore.js';
+import { Workflow, WorkflowStatus, StepStatus } from '../src/models.js';
+import { SDKRegistry } from '../src/sdk-registry.js';
+
+const createMockWorkflow = (steps: Workflow['steps']): Workflow => ({
+  metadata: { id: 'test', name: 'Test', version: '1.0.0' },
+  tools: {},
+  steps,
+});
+
+const createMockSDKRegistry = (): SDKRegistry =>
+  new SDKRegistry({
+    async load() {
+      return {};
+    },
+  });
+
+describe('buildStepDag', () => {
+  it('should leave independent steps without dependencies', () => {
+    const dag = buildStepDag([
+      { id: 'a', action: 'test.a', inputs: {}, outputVariable: 'user' },
+      { id: 'b', action: 'test.b', inputs: {}, outputVariable: 'settings' },
+    ] as Workflow['steps']);
+
+    expect(dag.dependencies).toEqual([[], []]);
+  });
+
+  it('should link steps that reference an earlier output variable', () => {
+    const dag = buildStepDag([
+      { id: 'a', action: 'test.a', inputs: {}, outputVariable: 'user' },
+      { id: 'b', action: 'test.b', inputs: {}, outputVariable: 'settings' },
+      { id: 'c', action: 'test.c', inputs: { name: '{{ user.name }}' } },
+    ] as Workflow['steps']);
+
+    expect(dag.dependencies[2]).toEqual([0]);
+    expect(dag.dependents[0]).toEqual([2]);
+  });
+
+  it('should link steps whose conditions check an earlier step status', () => {
+    const dag = buildStepDag([
+      { id: 'fetch', action: 'test.a', inputs: {} },
+      { id: 'notify', action: 'test.b', inputs: {}, conditions: ['fetch.status == "failed"'] },
+    ] as Workflow['steps']);
+
+    expect(dag.dependencies[1]).toEqual([0]);
+  });
+
+  it('should match hyphenated step ids and output variables as whole names', () => {
+    const dag = buildStepDag([
+      { id: 'fetch-user', action: 'test.a', inputs: {}, outputVariable: 'user-data' },
+      { id: 'notify', action: 'test.b', inputs: {}, conditions: ['fetch-user.status == "failed"'] },
+      { id: 'report', action: 'test.c', inputs: { user: '{{ user-data }}' } },
+      { id: 'other', action: 'test.d', inputs: { name: '{{ username }}' } },
+    ] as Workflow['steps']);
+
+    expect(dag.dependencies[1]).toEqual([0]);
+    expect(dag.dependencies[2]).toEqual([0]);
+    expect(dag.dependencies[3]).toEqual([]);
+  });
+
+  it('should order steps that write a variable an earlier step reads', () => {
+    const dag = buildStepDag([
+      { id: 'a', action: 'test.a', inputs: { value: '{{ data }}' } },
+      { id: 'b', action: 'test.b', inputs: {}, outputVariable: 'data' },
+    ] as Workflow['steps']);
+
+    expect(dag.dependencies[1]).toEqual([0]);
+  });
+
+  it('should treat workflow.* actions and control flow as barriers', () => {
+    const dag = buildStepDag([
+      { id: 'a', action: 'test.a', inputs: {} },
+      { id: 'outputs', action: 'workflow.set_outputs', inputs: {} },
+      { id: 'b', action: 'test.b', inputs: {} },
+      { id: 'wait', type: 'wait', mode: 'duration', duration: '1s' },
+      { id: 'c', action: 'test.c', inputs: {} },
+    ] as Workflow['steps']);
+
+    expect(dag.dependencies[1]).toEqual([0]);
+    expect(dag.dependencies[2]).toEqual([1]);
+    expect(dag.dependencies[3]).toEqual([0, 1, 2]);
+    expect(dag.dependencies[4]).toEqual([1, 3]);
+  });
+
+  it('should keep built-in file and event operations in order', () => {
+    const dag = buildStepDag([
+      { id: 'save', action: 'file.write', inputs: { path: './out.json', content: 'x' } },
+      { id: 'load', action: 'file.read', inputs: { path: './out.json' } },
+      { id: 'notify', action: 'event.send', inputs: {} },
+    ] as Workflow['steps']);
+
+    expect(dag.dependencies[1]).toEqual([0]);
+    expect(dag.dependencies[2]).toEqual([0, 1]);
+  });
+
+  it('should treat steps with an external prompt file as barriers', () => {
+    // The prompt file may reference {{ user }}, which the step definition never mentions
+    const dag = buildStepDag([
+      { id: 'a', action: 'test.a', inputs: {}, outputVariable: 'user' },
+      { id: 'review', action: 'agent.chat', inputs: {}, prompt: './prompts/review.md' },
+      { id: 'b', action: 'test.b', inputs: {} },
+    ] as Workflow['steps']);
+
+    expect(dag.dependencies[1]).toEqual([0]);
+    expect(dag.dependencies[2]).toEqual([1]);
+  });
+});
+
+describe('WorkflowEngine concurrent scheduling', () => {
+  it('should run independent steps concurrently when maxConcurrency > 1', async () => {
+    const workflow = createMockWorkflow([
+      { id: 'fetch_user', action: 'test.fetchUser', inputs: {}, outputVariable: 'user' },
+      { id: 'fetch_settings', action: 'test.fetchSettings', inputs: {}, outputVariable: 'settings' },
+      { id: 'fetch_stats', action: 'test.fetchStats', inputs: {}, outputVariable: 'stats' },
+      {
+        id: 'combine',
+        action: 'test.combine',
+        inputs: { user: '{{ user }}', settings: '{{ settings }}', stats: '{{ stats }}' },
+      },
+    ]);
+
+    let inFlight = 0;
+    let maxInFlight = 0;
+    const executor = vi.fn().mockImplementation(async (step) => {
+      inFlight++;
+      maxInFlight = Math.max(maxInFlight, inFlight);
+      await new Promise((resolve) => setTimeout(resolve, 10));
+      inFlight--;
+      return step.id === 'combine' ? step.inputs : step.id;
+    });
+
+    const engine = new WorkflowEngine({ maxConcurrency: 4 });
+    const result = await engine.execute(workflow, {}, createMockSDKRegistry(), executor);
+
+    expect(result.status).toBe(WorkflowStatus.COMPLETED);
+    expect(maxInFlight).toBe(3);
+    expect(result.stepResults.map((r) => r.stepId)).toEqual([
+      'fetch_user',
+      'fetch_settings',
+      'fetch_stats',
+      'combine',
+    ]);
+    expect(result.stepResults[3].output).toEqual({
+      user: 'fetch_user',
+      settings: 'fetch_settings',
+      stats: 'fetch_stats',
+    });
+  });
+
+  it('should respect the maxConcurrency limit', async () => {
+    const workflow = createMockWorkflow(
+      ['a', 'b', 'c', 'd'].map((id) => ({ id, action: `test.${id}`, inputs: {} }))
+    );
+
+    let inFlight = 0;
+    let maxInFlight = 0;
+    const executor = vi.fn().mockImplementation(async () => {
+      inFlight++;
+      maxInFlight = Math.max(maxInFlight, inFlight);
+      await new Promise((resolve) => setTimeout(resolve, 10));
+      inFlight--;
+      return {};
+    });
+
+    const engine = new WorkflowEngine({ maxConcurrency: 2 });
+    const result = await engine.execute(workflow, {}, createMockSDKRegistry(), executor);
+
+    expect(result.status).toBe(WorkflowStatus.COMPLETED);
+    expect(executor).toHaveBeenCalledTimes(4);
+    expect(maxInFlight).toBe(2);
+  });
+
+  it('should limit concurrent executor calls per service', async () => {
+    const workflow = createMockWorkflow([
+      ...['a', 'b', 'c', 'd'].map((id) => ({ id, action: 'api.call', inputs: {} })),
+      { id: 'e', action: 'other.call', inputs: {} },
+    ]);
+
+    const inFlight = new Map<string, number>();
+    const maxInFlight = new Map<string, number>();
+    const executor = vi.fn().mockImplementation(async (step) => {
+      const service = step.action.split('.')[0];
+      inFlight.set(service, (inFlight.get(service) ?? 0) + 1);
+      maxInFlight.set(service, Math.max(maxInFlight.get(service) ?? 0, inFlight.get(service)!));
+      await new Promise((resolve) => setTimeout(resolve, 10));
+      inFlight.set(service, inFlight.get(service)! - 1);
+      return {};
+    });
+
+    const engine = new WorkflowEngine({ maxConcurrency: 5, maxServiceConcurrency: 2 });
+    const result = await engine.execute(workflow, {}, createMockSDKRegistry(), executor);
+
+    expect(result.status).toBe(WorkflowStatus.COMPLETED);
+    expect(executor).toHaveBeenCalledTimes(5);
+    expect(maxInFlight.get('api')).toBe(2);
+    expect(maxInFlight.get('other')).toBe(1);
+  });
+
+  it('should reject a maxServiceConcurrency below 1', () => {
+    expect(() => new WorkflowEngine({ maxServiceConcurrency: 0 })).toThrow(
+      'Invalid maxServiceConcurrency: 0'
+    );
+    expect(() => new Semaphore(0)).toThrow('Semaphore limit must be at least 1');
+  });
+
+  it('should resolve condition-skipped steps without dispatching them', async () => {
+    const workflow = createMockWorkflow([
+      { id: 'detect', action: 'test.detect', inputs: {}, outputVariable: 'mode' },
+      {
+        id: 'extra',
+        action: 'test.extra',
+        inputs: {},
+        conditions: ['mode == "full"'],
+        outputVariable: 'details',
+      },
+      { id: 'report', action: 'test.report', inputs: { details: '{{ details }}' } },
+    ]);
+
+    const executor = vi.fn().mockImplementation(async (step) => (step.id === 'detect' ? 'lite' : {}));
+
+    const engine = new WorkflowEngine({ maxConcurrency: 4 });
+    const result = await engine.execute(workflow, {}, createMockSDKRegistry(), executor);
+
+    expect(result.status).toBe(WorkflowStatus.COMPLETED);
+    expect(result.stepResults.map((r) => r.status)).toEqual([
+      StepStatus.COMPLETED,
+      StepStatus.SKIPPED,
+      StepStatus.COMPLETED,
+    ]);
+    expect(executor).toHaveBeenCalledTimes(2);
+  });
+
+  it('should not start new steps after a stopping failure', async () => {
+    const workflow = createMockWorkflow([
+      { id: 'fails', action: 'fails.run', inputs: {}, outputVariable: 'failed' },
+      { id: 'sibling', action: 'slow.run', inputs: {} },
+      { id: 'after', action: 'test.after', inputs: { value: '{{ failed }}' } },
+    ]);
+
+    const executor = vi.fn().mockImplementation(async (step) => {
+      if (step.id === 'fails') throw new Error('boom');
+      await new Promise((resolve) => setTimeout(resolve, 10));
+      return {};
+    });
+
+    const engine = new WorkflowEngine({ maxConcurrency: 4, maxRetries: 0 });
+    const result = await engine.execute(workflow, {}, createMockSDKRegistry(), executor);
+
+    expect(result.status).toBe(WorkflowStatus.FAILED);
+    expect(result.error).toContain('boom');
+    expect(result.stepResults.map((r) => [r.stepId, r.status])).toEqual([
+      ['fails', StepStatus.FAILED],
+      ['sibling', StepStatus.COMPLETED],
+    ]);
+    expect(executor).not.toHaveBeenCalledWith(
+      expect.objectContaining({ id: 'after' }),
+      expect.anything(),
+      expect.anything(),
+      expect.anything(),
+    );
+  });
+
+  it('should stop in-flight siblings from retrying after a stopping failure', async () => {
+    const workflow = createMockWorkflow([
+      {
+        id: 'fails',
+        action: 'fails.run',
+        inputs: {},
+        errorHandling: { action: 'stop', maxRetries: 0, retryDelaySeconds: 0 },
+      },
+      { id: 'flaky', action: 'flaky.run', inputs: {} },
+    ]);
+
+    const executor = vi.fn().mockImplementation(async (step) => {
+      if (step.id === 'fails') throw new Error('boom');
+      await new Promise((resolve) => setTimeout(resolve, 10));
+      throw new Error('flaky');
+    });
+
+    // Without cancellation the sibling would back off for 10s, 20s and 40s
+    const engine = new WorkflowEngine({ maxConcurrency: 2, maxRetries: 3, retryBaseDelay: 10000 });
+    const result = await engine.execute(workflow, {}, createMockSDKRegistry(), executor);
+
+    expect(result.status).toBe(WorkflowStatus.FAILED);
+    expect(result.error).toContain('boom');
+    expect(result.stepResults.map((r) => [r.stepId, r.status, r.retryCount])).toEqual([
+      ['fails', StepStatus.FAILED, 0],
+      ['flaky', StepStatus.FAILED, 0],
+    ]);
+    expect(executor).toHaveBeenCalledTimes(2);
+  });
+});
@@ -1,6 +1,6 @@
 import { describe, it, expect } from 'vitest';
 import { WorkflowEngine } from '../src/engine.js';
-import { createExecutionContext, type Workflow, StepStatus } from '../src/models.js';
+import { type Workflow, StepStatus } from '../src/models.js';
 
 const workflow: Workflow = {
   metadata: { id: 'wf1', name: 'Test' },
@@ -37,4 +37,33 @@ describe('WorkflowEngine failover', () => {
     expect(history.length).toBe(1);
     expect(history[0].toAgent).toBe('fallback');
   });
+
+  it('records the failing step index when steps run concurrently', async () => {
+    const engine = new WorkflowEngine({
+      failoverConfig: { fallbackAgents: ['fallback'], maxFailoverAttempts: 1 },
+      maxRetries: 0,
+      maxConcurrency: 2,
+    });
+
+    const concurrentWorkflow: Workflow = {
+      ...workflow,
+      steps: [
+        { id: 'slow', action: 'primary.do', inputs: {} },
+        { id: 'other', action: 'other.do', inputs: {} },
+      ],
+    };
+
+    const stepExecutor = async (step: any) => {
+      if (step.action.startsWith('primary.')) {
+        await new Promise((resolve) => setTimeout(resolve, 10));
+        throw new Error('primary failed');
+      }
+      return { ok: true };
+    };
+
+    await engine.execute(concurrentWorkflow, {}, { load: async () => ({}), has: () => true }, stepExecutor);
+    const history = engine.getFailoverHistory();
+    expect(history.length).toBe(1);
+    expect(history[0].stepIndex).toBe(0);
+  });
 });
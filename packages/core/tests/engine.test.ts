@@ -1,79 +1,247 @@
-import { describe, it, expect, vi } from 'vitest';
+import { describe, it, expect, vi, beforeEach } from 'vitest';
 import { WorkflowEngine, RetryPolicy, CircuitBreaker, resolveTemplates } from '../src/engine.js';
 import { Workflow, WorkflowStatus, StepStatus, ExecutionContext } from '../src/models.js';
 import { SDKRegistry } from '../src/sdk-registry.js';
+import { evaluateCondition } from '../src/engine/conditions.js';
 
 describe('RetryPolicy', () => {
-  it('should calculate exponential backoff delay', () => {
-    const policy = new RetryPolicy(3, 1000, 30000, 2, 0);
+  const exponentialPolicy = new RetryPolicy(3, 1000, 30000, 2, 0);
+  const cappedPolicy = new RetryPolicy(10, 1000, 5000, 2, 0);
+
+  // Reference oracle: min(base * 2^attempt, maxDelay) across the first 20 attempts
+  const attempts = Array.from({ length: 20 }, (_, attempt) => attempt);
+  const expectedDelays = (base: number, max: number) =>
+    attempts.map((attempt) => Math.min(base * 2 ** attempt, max));
 
-    expect(policy.getDelay(0)).toBe(1000);
-    expect(policy.getDelay(1)).toBe(2000);
-    expect(policy.getDelay(2)).toBe(4000);
+  it('should calculate exponential backoff delay', () => {
+    expect(attempts.map((attempt) => exponentialPolicy.getDelay(attempt))).toEqual(
+      expectedDelays(1000, 30000)
+    );
   });
 
   it('should respect max delay', () => {
-    const policy = new RetryPolicy(10, 1000, 5000, 2, 0);
-
-    expect(policy.getDelay(5)).toBe(5000);
-    expect(policy.getDelay(10)).toBe(5000);
+    expect(attempts.map((attempt) => cappedPolicy.getDelay(attempt))).toEqual(
+      expectedDelays(1000, 5000)
+    );
   });
 
   it('should add jitter', () => {
+    const random = vi.fn().mockReturnValueOnce(0).mockReturnValueOnce(0.75);
+    const policy = new RetryPolicy(3, 1000, 30000, 2, 0.5, random);
+
+    // With 50% jitter, delays spread across 500..1500
+    expect(policy.getDelay(0)).toBe(500);
+    expect(policy.getDelay(0)).toBe(1250);
+    expect(random).toHaveBeenCalledTimes(2);
+  });
+
+  it('should read Math.random at call time by default', () => {
     const policy = new RetryPolicy(3, 1000, 30000, 2, 0.5);
+    const random = vi.spyOn(Math, 'random').mockReturnValue(1);
 
-    // With 50% jitter, delay should vary
-    const delays = new Set<number>();
-    for (let i = 0; i < 10; i++) {
-      delays.add(policy.getDelay(0));
+    try {
+      expect(policy.getDelay(0)).toBe(1500);
+      expect(random).toHaveBeenCalledTimes(1);
+    } finally {
+      random.mockRestore();
     }
-
-    // Should have multiple different values due to jitter
-    expect(delays.size).toBeGreaterThan(1);
   });
 });
 
 describe('CircuitBreaker', () => {
+  const createFakeClock = () => {
+    let now = 0;
+    return Object.assign(() => now, {
+      advance: (ms: number) => {
+        now += ms;
+      },
+    });
+  };
+
+  // Read-only breakers shared by inspection tests; never record results on these
+  const defaultBreaker = new CircuitBreaker();
+  const customBreaker = new CircuitBreaker(3, 60000, 5, 600000);
+
+  // Shared breakers for the transition tests, reset before each one
+  const clock = createFakeClock();
+  const thresholdBreaker = new CircuitBreaker(3, 1000, 1);
+  const timedBreaker = new CircuitBreaker(1, 500, 1, 3000, clock);
+  const probeBreaker = new CircuitBreaker(1, 500, 2, 3000, clock);
+
+  beforeEach(() => {
+    thresholdBreaker.reset();
+    timedBreaker.reset();
+    probeBreaker.reset();
+  });
+
   it('should start in CLOSED state', () => {
-    const breaker = new CircuitBreaker();
-    expect(breaker.getState()).toBe('CLOSED');
-    expect(breaker.canExecute()).toBe(true);
+    expect(defaultBreaker.getState()).toBe('CLOSED');
+    expect(defaultBreaker.canExecute()).toBe(true);
   });
 
-  it('should open after threshold failures', () => {
-    const breaker = new CircuitBreaker(3, 1000, 1);
+  it('should use default thresholds', () => {
+    expect(defaultBreaker.failureThreshold).toBe(5);
+    expect(defaultBreaker.recoveryTimeout).toBe(30000);
+    expect(defaultBreaker.halfOpenMaxCalls).toBe(3);
+    expect(defaultBreaker.maxRecoveryTimeout).toBe(300000);
+    expect(defaultBreaker.getRecoveryTimeout()).toBe(30000);
+  });
 
-    breaker.recordFailure();
-    expect(breaker.getState()).toBe('CLOSED');
+  it('should accept custom thresholds', () => {
+    expect(customBreaker.failureThreshold).toBe(3);
+    expect(customBreaker.recoveryTimeout).toBe(60000);
+    expect(customBreaker.halfOpenMaxCalls).toBe(5);
+    expect(customBreaker.maxRecoveryTimeout).toBe(600000);
+    expect(customBreaker.getState()).toBe('CLOSED');
+  });
 
-    breaker.recordFailure();
-    expect(breaker.getState()).toBe('CLOSED');
+  it('should open after threshold failures', () => {
+    for (let i = 0; i < 3; i++) {
+      expect(thresholdBreaker.canExecute()).toBe(true);
+      thresholdBreaker.recordFailure();
+    }
 
-    breaker.recordFailure();
-    expect(breaker.getState()).toBe('OPEN');
-    expect(breaker.canExecute()).toBe(false);
+    expect(thresholdBreaker.canExecute()).toBe(false);
+    expect(thresholdBreaker.getState()).toBe('OPEN');
   });
 
   it('should reset on success', () => {
-    const breaker = new CircuitBreaker(3, 1000, 1);
+    thresholdBreaker.recordFailure();
+    thresholdBreaker.recordFailure();
+    thresholdBreaker.recordSuccess();
 
-    breaker.recordFailure();
-    breaker.recordFailure();
-    breaker.recordSuccess();
+    expect(thresholdBreaker.getState()).toBe('CLOSED');
+  });
+
+  it('should hold its state invariants across generated operation sequences', () => {
+    // Small deterministic LCG so any failing sequence reproduces exactly
+    let seed = 42;
+    const nextRandom = () => {
+      seed = (Math.imul(seed, 1103515245) + 12345) >>> 0;
+      return seed / 4294967296;
+    };
+
+    for (let run = 0; run < 50; run++) {
+      const clock = createFakeClock();
+      const breaker = new CircuitBreaker(3, 100, 1, 800, clock);
+      let failuresSinceSuccess = 0;
+      let lastFailureAt = 0;
+      let probes = 0;
+
+      for (let op = 0; op < 40; op++) {
+        const roll = nextRandom();
+        const before = breaker.getState();
+
+        if (roll < 0.4) {
+          breaker.recordFailure();
+          failuresSinceSuccess++;
+          lastFailureAt = clock();
+          const shouldOpen = before !== 'CLOSED' || failuresSinceSuccess >= breaker.failureThreshold;
+          expect(breaker.getState()).toBe(shouldOpen ? 'OPEN' : 'CLOSED');
+        } else if (roll < 0.55) {
+          breaker.recordSuccess();
+          failuresSinceSuccess = 0;
+          expect(breaker.getState()).toBe('CLOSED');
+          expect(breaker.getRecoveryTimeout()).toBe(breaker.recoveryTimeout);
+        } else if (roll < 0.8) {
+          clock.advance(Math.floor(nextRandom() * 300));
+        } else {
+          const allowed = breaker.canExecute();
+          if (before === 'OPEN') {
+            const recovered = clock() - lastFailureAt >= breaker.getRecoveryTimeout();
+            expect(allowed).toBe(recovered);
+            expect(breaker.getState()).toBe(recovered ? 'HALF_OPEN' : 'OPEN');
+            probes = recovered ? 1 : 0;
+          } else if (before === 'HALF_OPEN') {
+            expect(allowed).toBe(probes < breaker.halfOpenMaxCalls);
+            expect(breaker.getState()).toBe('HALF_OPEN');
+            if (allowed) probes++;
+          } else {
+            expect(allowed).toBe(true);
+            expect(breaker.getState()).toBe('CLOSED');
+          }
+        }
+
+        expect(breaker.getRecoveryTimeout()).toBeGreaterThanOrEqual(breaker.recoveryTimeout);
+        expect(breaker.getRecoveryTimeout()).toBeLessThanOrEqual(breaker.maxRecoveryTimeout);
+      }
+    }
+  });
+
+  it('should transition to HALF_OPEN after recovery timeout', () => {
+    timedBreaker.recordFailure();
+    expect(timedBreaker.getState()).toBe('OPEN');
+
+    clock.advance(499);
+    expect(timedBreaker.canExecute()).toBe(false);
+
+    clock.advance(1);
+    expect(timedBreaker.canExecute()).toBe(true);
+    expect(timedBreaker.getState()).toBe('HALF_OPEN');
+  });
 
-    expect(breaker.getState()).toBe('CLOSED');
+  it('should time recovery with the monotonic clock by default', () => {
+    const now = vi.spyOn(performance, 'now').mockReturnValue(10_000);
+
+    try {
+      const breaker = new CircuitBreaker(1, 1000);
+      breaker.recordFailure();
+
+      now.mockReturnValue(10_999);
+      expect(breaker.canExecute()).toBe(false);
+
+      now.mockReturnValue(11_000);
+      expect(breaker.canExecute()).toBe(true);
+    } finally {
+      now.mockRestore();
+    }
   });
 
-  it('should transition to HALF_OPEN after recovery timeout', async () => {
-    const breaker = new CircuitBreaker(1, 50, 1);
+  it.each([
+    [1, true],
+    [2, true],
+    [3, false],
+    [4, false],
+  ])('should allow half-open probe %i: %s', (probe, allowed) => {
+    probeBreaker.recordFailure();
+    clock.advance(probeBreaker.getRecoveryTimeout());
+
+    // The OPEN -> HALF_OPEN transition itself counts as the first probe
+    for (let i = 1; i < probe; i++) {
+      probeBreaker.canExecute();
+    }
 
-    breaker.recordFailure();
-    expect(breaker.getState()).toBe('OPEN');
+    expect(probeBreaker.canExecute()).toBe(allowed);
+    expect(probeBreaker.getState()).toBe('HALF_OPEN');
+  });
 
-    await new Promise((resolve) => setTimeout(resolve, 100));
+  it('should double the recovery timeout each time it re-opens', () => {
+    const timeouts: number[] = [];
+    for (let i = 0; i < 5; i++) {
+      timedBreaker.recordFailure();
+      timeouts.push(timedBreaker.getRecoveryTimeout());
 
-    expect(breaker.canExecute()).toBe(true);
-    expect(breaker.getState()).toBe('HALF_OPEN');
+      clock.advance(timedBreaker.getRecoveryTimeout() - 1);
+      expect(timedBreaker.canExecute()).toBe(false);
+      clock.advance(1);
+      expect(timedBreaker.canExecute()).toBe(true);
+    }
+
+    expect(timeouts).toEqual([500, 1000, 2000, 3000, 3000]);
+  });
+
+  it('should reset the recovery backoff when the circuit closes', () => {
+    timedBreaker.recordFailure();
+    clock.advance(500);
+    expect(timedBreaker.canExecute()).toBe(true);
+    timedBreaker.recordFailure();
+    expect(timedBreaker.getRecoveryTimeout()).toBe(1000);
+
+    clock.advance(1000);
+    expect(timedBreaker.canExecute()).toBe(true);
+    timedBreaker.recordSuccess();
+    timedBreaker.recordFailure();
+    expect(timedBreaker.getRecoveryTimeout()).toBe(500);
   });
 });
 
@@ -153,6 +321,49 @@ describe('resolveTemplates', () => {
     const result = resolveTemplates('{{ message | lower | capitalize }}', context);
     expect(result).toBe('Hello world');
   });
+
+  it('should pass through static strings untouched', () => {
+    const input = {
+      schema: '{"type": "object", "required": ["id"]}',
+      text: 'Use }} and { literally',
+      nested: ['plain', '{{message}}'],
+    };
+    const result = resolveTemplates(input, context);
+    expect(result).toEqual({
+      schema: '{"type": "object", "required": ["id"]}',
+      text: 'Use }} and { literally',
+      nested: ['plain', 'Hello World'],
+    });
+  });
+});
+
+describe('evaluateCondition', () => {
+  const createContext = (variables: Record<string, unknown>): ExecutionContext => ({
+    workflowId: 'test',
+    runId: 'run-1',
+    variables,
+    inputs: {},
+    startedAt: new Date(),
+    currentStepIndex: 0,
+    status: WorkflowStatus.RUNNING,
+    stepMetadata: { fetch: { status: 'failed', retryCount: 0 } },
+  });
+
+  it('should re-resolve a repeated condition against the current context', () => {
+    expect(evaluateCondition('count >= 3', createContext({ count: 5 }))).toBe(true);
+    expect(evaluateCondition('count >= 3', createContext({ count: 1 }))).toBe(false);
+  });
+
+  it('should evaluate literals, truthiness, filters and step status checks', () => {
+    const context = createContext({ name: 'Alice', enabled: true, empty: '' });
+
+    expect(evaluateCondition('name == "Alice"', context)).toBe(true);
+    expect(evaluateCondition('name != "Alice"', context)).toBe(false);
+    expect(evaluateCondition('enabled', context)).toBe(true);
+    expect(evaluateCondition('empty', context)).toBe(false);
+    expect(evaluateCondition('name | lower == "alice"', context)).toBe(true);
+    expect(evaluateCondition('fetch.status == "failed"', context)).toBe(true);
+  });
 });
 
 describe('WorkflowEngine', () => {
@@ -219,6 +430,8 @@ describe('WorkflowEngine', () => {
     const result = await engine.execute(workflow, {}, registry, executor);
 
     expect(result.stepResults[1].status).toBe(StepStatus.SKIPPED);
+    expect(result.stepResults[1].completedAt).toBe(result.stepResults[1].startedAt);
+    expect(result.stepResults[1].duration).toBe(0);
     expect(executor).toHaveBeenCalledOnce();
   });
 
@@ -239,6 +452,28 @@ describe('WorkflowEngine', () => {
     expect(executor).toHaveBeenCalledTimes(3);
   });
 
+  it('should reuse the executor context across retries and runs until its inputs change', async () => {
+    const workflow = createMockWorkflow([{ id: 'step1', action: 'test.action', inputs: {} }]);
+
+    const engine = new WorkflowEngine({ maxRetries: 1, retryBaseDelay: 10 });
+    const registry = createMockSDKRegistry();
+    const executor = vi
+      .fn()
+      .mockRejectedValueOnce(new Error('Fail 1'))
+      .mockResolvedValue({ success: true });
+
+    await engine.execute(workflow, {}, registry, executor);
+    expect(executor.mock.calls[1][3]).toBe(executor.mock.calls[0][3]);
+
+    await engine.execute(workflow, {}, registry, executor);
+    expect(executor.mock.calls[2][3]).toBe(executor.mock.calls[0][3]);
+
+    engine.workflowPath = '/tmp/elsewhere';
+    await engine.execute(workflow, {}, registry, executor);
+    expect(executor.mock.calls[3][3]).not.toBe(executor.mock.calls[0][3]);
+    expect(executor.mock.calls[3][3].basePath).toBe('/tmp/elsewhere');
+  });
+
   it('should fail after max retries', async () => {
     const workflow = createMockWorkflow([{ id: 'step1', action: 'test.action', inputs: {} }]);
 
@@ -253,6 +488,22 @@ describe('WorkflowEngine', () => {
     expect(executor).toHaveBeenCalledTimes(3); // 1 + 2 retries
   });
 
+  it('should stop retrying once the circuit breaker opens', async () => {
+    const workflow = createMockWorkflow([{ id: 'step1', action: 'test.action', inputs: {} }]);
+
+    const engine = new WorkflowEngine({ maxRetries: 10, retryBaseDelay: 1 });
+    const registry = createMockSDKRegistry();
+    const executor = vi.fn().mockRejectedValue(new Error('Always fails'));
+
+    const result = await engine.execute(workflow, {}, registry, executor);
+
+    // The default breaker opens after 5 failures
+    expect(result.status).toBe(WorkflowStatus.FAILED);
+    expect(executor).toHaveBeenCalledTimes(5);
+    expect(result.stepResults[0].retryCount).toBe(4);
+    expect((result.stepResults[0].error as Error).message).toBe('Always fails');
+  });
+
   it('should call event handlers', async () => {
     const workflow = createMockWorkflow([{ id: 'step1', action: 'test.action', inputs: {} }]);
 
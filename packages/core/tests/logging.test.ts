@@ -0,0 +1,72 @@
+/**
+ * Tests for ExecutionLogger stdout destination selection.
+ */
+
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import pino, { type DestinationStream } from 'pino';
+import { ExecutionLogger } from '../src/logging.js';
+
+const createMemoryDestination = () => {
+  const lines: string[] = [];
+  const destination: DestinationStream = {
+    write: (line: string) => {
+      lines.push(line);
+    },
+  };
+  return { lines, destination };
+};
+
+describe('ExecutionLogger destination', () => {
+  afterEach(() => {
+    vi.restoreAllMocks();
+  });
+
+  const spyOnDestination = () =>
+    vi
+      .spyOn(pino, 'destination')
+      .mockImplementation(
+        () => createMemoryDestination().destination as unknown as ReturnType<typeof pino.destination>
+      );
+
+  it('should write stdout through the async sink by default', () => {
+    const destination = spyOnDestination();
+
+    new ExecutionLogger({ logsDir: '/tmp/marktoflow-logs' });
+
+    expect(destination).toHaveBeenCalledWith({ dest: 1, sync: false });
+  });
+
+  it('should use the async sink for the legacy string constructor', () => {
+    const destination = spyOnDestination();
+
+    new ExecutionLogger('/tmp/marktoflow-logs');
+
+    expect(destination).toHaveBeenCalledWith({ dest: 1, sync: false });
+  });
+
+  it('should restore synchronous writes with sync: true', () => {
+    const destination = spyOnDestination();
+
+    new ExecutionLogger({ logsDir: '/tmp/marktoflow-logs', sync: true });
+
+    expect(destination).toHaveBeenCalledWith({ dest: 1, sync: true });
+  });
+
+  it('should pass a custom destination through unchanged', () => {
+    const destination = spyOnDestination();
+    const memory = createMemoryDestination();
+
+    const logger = new ExecutionLogger({
+      logsDir: '/tmp/marktoflow-logs',
+      destination: memory.destination,
+    });
+    logger.startLog('run-1', 'wf-1', 'Test Workflow');
+
+    expect(destination).not.toHaveBeenCalled();
+    expect(memory.lines).toHaveLength(1);
+    expect(JSON.parse(memory.lines[0])).toMatchObject({
+      runId: 'run-1',
+      msg: 'Workflow execution started',
+    });
+  });
+});
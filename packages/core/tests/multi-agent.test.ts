@@ -2,7 +2,7 @@ import { describe, it, expect, vi, beforeEach } from 'vitest';
 import { WorkflowEngine } from '../src/engine.js';
 import { parseContent } from '../src/parser.js';
 import { SDKRegistry } from '../src/sdk-registry.js';
-import { WorkflowStatus, StepStatus } from '../src/models.js';
+import { WorkflowStatus } from '../src/models.js';
 
 describe('Multi-Agent Workflow Tests', () => {
   let mockSDKRegistry: SDKRegistry;
@@ -1,4 +1,4 @@
-import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
 import { ScriptTool } from '../src/script-tool.js';
 import { writeFileSync, unlinkSync, chmodSync } from 'node:fs';
 import { join } from 'node:path';
@@ -1,10 +1,9 @@
-import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import { describe, it, expect, beforeEach } from 'vitest';
 import { 
   RBACManager, Permission, Role, User, 
   ApprovalManager, ApprovalStatus, 
   AuditLogger, InMemoryAuditStore, AuditEventType 
 } from '../src/security.js';
-import { randomUUID } from 'crypto';
 
 describe('RBACManager', () => {
   let rbac: RBACManager;
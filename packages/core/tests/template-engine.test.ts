@@ -489,4 +489,28 @@ describe('renderTemplate', () => {
       expect(result).toBe('- Task 1\n- Task 2\n- Task 3\n');
     });
   });
+
+  describe('compiled template reuse', () => {
+    it('should render a repeated template against each new context', () => {
+      const templates = ['{{ user.name }}', '{{ count + 1 }}', 'Hi {{ user.name }}'];
+      const first = templates.map((t) => renderTemplate(t, { user: { name: 'Ann' }, count: 1 }));
+      const second = templates.map((t) => renderTemplate(t, { user: { name: 'Bo' }, count: 5 }));
+
+      expect(first).toEqual(['Ann', 2, 'Hi Ann']);
+      expect(second).toEqual(['Bo', 6, 'Hi Bo']);
+    });
+
+    it('should render templates too long to cache against each new context', () => {
+      const prompt = `Review for {{ user.name }}:\n${'Context line.\n'.repeat(500)}`;
+
+      expect(renderTemplate(prompt, { user: { name: 'Ann' } })).toBe(prompt.replace('{{ user.name }}', 'Ann'));
+      expect(renderTemplate(prompt, { user: { name: 'Bo' } })).toBe(prompt.replace('{{ user.name }}', 'Bo'));
+    });
+
+    it('should keep returning the original text for a template that fails to compile', () => {
+      const broken = 'Value: {% if %}';
+      expect(renderTemplate(broken, {})).toBe(broken);
+      expect(renderTemplate(broken, {})).toBe(broken);
+    });
+  });
 });
@@ -1,4 +1,4 @@
-import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { describe, it, expect, vi } from 'vitest';
 import { WorkflowEngine } from '../src/engine.js';
 import { parseContent } from '../src/parser.js';
 import { SDKRegistry } from '../src/sdk-registry.js';
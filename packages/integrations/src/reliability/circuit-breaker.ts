@@ -25,6 +25,8 @@ export interface CircuitBreakerOptions {
   failureWindow?: number;
   /** Called when circuit state changes */
   onStateChange?: (service: string, from: CircuitState, to: CircuitState) => void;
+  /** Current time in ms, injectable for tests (default: Date.now) */
+  clock?: () => number;
 }
 
 interface CircuitRecord {
@@ -35,7 +37,7 @@ interface CircuitRecord {
   openedAt: number;
 }
 
-const DEFAULT_OPTIONS: Required<Omit<CircuitBreakerOptions, 'onStateChange'>> = {
+const DEFAULT_OPTIONS: Required<Omit<CircuitBreakerOptions, 'onStateChange' | 'clock'>> = {
   failureThreshold: 5,
   resetTimeout: 30_000,
   successThreshold: 2,
@@ -44,8 +46,9 @@ const DEFAULT_OPTIONS: Required<Omit<CircuitBreakerOptions, 'onStateChange'>> =
 
 export class CircuitBreakerRegistry {
   private circuits = new Map<string, CircuitRecord>();
-  private options: Required<Omit<CircuitBreakerOptions, 'onStateChange'>>;
+  private options: Required<Omit<CircuitBreakerOptions, 'onStateChange' | 'clock'>>;
   private onStateChange?: CircuitBreakerOptions['onStateChange'];
+  private clock: () => number;
 
   constructor(options: CircuitBreakerOptions = {}) {
     this.options = {
@@ -55,6 +58,7 @@ export class CircuitBreakerRegistry {
       failureWindow: options.failureWindow ?? DEFAULT_OPTIONS.failureWindow,
     };
     this.onStateChange = options.onStateChange;
+    this.clock = options.clock ?? Date.now;
   }
 
   /**
@@ -63,7 +67,7 @@ export class CircuitBreakerRegistry {
    */
   allowRequest(service: string): void {
     const circuit = this.getCircuit(service);
-    const now = Date.now();
+    const now = this.clock();
 
     switch (circuit.state) {
       case 'closed':
@@ -108,7 +112,7 @@ export class CircuitBreakerRegistry {
    */
   recordFailure(service: string): void {
     const circuit = this.getCircuit(service);
-    const now = Date.now();
+    const now = this.clock();
 
     if (circuit.state === 'half_open') {
       // Any failure in half-open reopens the circuit
@@ -140,7 +144,7 @@ export class CircuitBreakerRegistry {
    */
   getStats(): Record<string, { state: CircuitState; recentFailures: number }> {
     const stats: Record<string, { state: CircuitState; recentFailures: number }> = {};
-    const now = Date.now();
+    const now = this.clock();
 
     for (const [service, circuit] of this.circuits) {
       const recentFailures = circuit.failures.filter(
@@ -186,7 +190,7 @@ export class CircuitBreakerRegistry {
     circuit.state = to;
 
     if (to === 'open') {
-      circuit.openedAt = Date.now();
+      circuit.openedAt = this.clock();
       circuit.successes = 0;
     } else if (to === 'closed') {
       circuit.failures = [];
@@ -66,8 +66,12 @@ export interface CreateInvoiceOptions {
 export class StripeClient {
   private stripe: Stripe;
 
-  constructor(apiKey: string, config?: { apiVersion?: string }) {
-    this.stripe = new Stripe(apiKey, {
+  constructor(
+    apiKey: string,
+    config?: { apiVersion?: string },
+    StripeSDK: typeof Stripe = Stripe
+  ) {
+    this.stripe = new StripeSDK(apiKey, {
       apiVersion: (config?.apiVersion as Stripe.LatestApiVersion) || '2024-12-18.acacia',
       typescript: true,
     });
@@ -371,8 +375,20 @@ export class StripeClient {
   }
 }
 
+/**
+ * Get the Stripe constructor from the module SDKRegistry already loaded,
+ * falling back to this package's own import.
+ */
+function getStripeConstructor(module: unknown): typeof Stripe {
+  if (typeof module === 'function') {
+    return module as typeof Stripe;
+  }
+  const defaultExport = (module as { default?: unknown } | null)?.default;
+  return typeof defaultExport === 'function' ? (defaultExport as typeof Stripe) : Stripe;
+}
+
 export const StripeInitializer: SDKInitializer = {
-  async initialize(_module: unknown, config: ToolConfig): Promise<unknown> {
+  async initialize(module: unknown, config: ToolConfig): Promise<unknown> {
     const apiKey = config.auth?.['api_key'] as string | undefined;
     if (!apiKey) {
       throw new Error('Stripe SDK requires auth.api_key');
@@ -380,7 +396,7 @@ export const StripeInitializer: SDKInitializer = {
 
     const apiVersion = config.options?.['api_version'] as string | undefined;
 
-    const client = new StripeClient(apiKey, { apiVersion });
+    const client = new StripeClient(apiKey, { apiVersion }, getStripeConstructor(module));
     const wrapped = wrapIntegration('stripe', client, {
       timeout: 30000,
       retryOn: [429, 500, 502, 503],
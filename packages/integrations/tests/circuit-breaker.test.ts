@@ -11,13 +11,16 @@ import { wrapIntegration } from '../src/reliability/wrapper.js';
 
 describe('CircuitBreakerRegistry', () => {
   let registry: CircuitBreakerRegistry;
+  let now: number;
 
   beforeEach(() => {
+    now = 0;
     registry = new CircuitBreakerRegistry({
       failureThreshold: 3,
       resetTimeout: 100,
       successThreshold: 2,
       failureWindow: 5000,
+      clock: () => now,
     });
   });
 
@@ -44,20 +47,23 @@ describe('CircuitBreakerRegistry', () => {
     expect(() => registry.allowRequest('test-service')).toThrow('Circuit breaker is open');
   });
 
-  it('should transition to half-open after reset timeout', async () => {
+  it('should transition to half-open after reset timeout', () => {
     for (let i = 0; i < 3; i++) registry.recordFailure('test-service');
     expect(registry.getState('test-service')).toBe('open');
 
-    await new Promise((r) => setTimeout(r, 150));
+    now += 99;
+    expect(() => registry.allowRequest('test-service')).toThrow('Circuit breaker is open');
+
+    now += 1;
 
     // allowRequest should succeed and transition to half_open
     expect(() => registry.allowRequest('test-service')).not.toThrow();
     expect(registry.getState('test-service')).toBe('half_open');
   });
 
-  it('should close after enough successes in half-open', async () => {
+  it('should close after enough successes in half-open', () => {
     for (let i = 0; i < 3; i++) registry.recordFailure('test-service');
-    await new Promise((r) => setTimeout(r, 150));
+    now += 100;
     registry.allowRequest('test-service'); // transitions to half_open
 
     registry.recordSuccess('test-service');
@@ -67,9 +73,9 @@ describe('CircuitBreakerRegistry', () => {
     expect(registry.getState('test-service')).toBe('closed');
   });
 
-  it('should reopen on failure in half-open', async () => {
+  it('should reopen on failure in half-open', () => {
     for (let i = 0; i < 3; i++) registry.recordFailure('test-service');
-    await new Promise((r) => setTimeout(r, 150));
+    now += 100;
     registry.allowRequest('test-service'); // transitions to half_open
 
     registry.recordFailure('test-service');
@@ -87,20 +93,19 @@ describe('CircuitBreakerRegistry', () => {
     const shortWindowRegistry = new CircuitBreakerRegistry({
       failureThreshold: 3,
       failureWindow: 50,
+      clock: () => now,
     });
 
     shortWindowRegistry.recordFailure('svc');
     shortWindowRegistry.recordFailure('svc');
 
-    // Wait for failures to expire
-    return new Promise<void>((resolve) => {
-      setTimeout(() => {
-        shortWindowRegistry.recordFailure('svc');
-        // Only 1 recent failure (other 2 expired), should still be closed
-        expect(shortWindowRegistry.getState('svc')).toBe('closed');
-        resolve();
-      }, 80);
-    });
+    // Let the first two failures fall out of the window
+    now += 50;
+    shortWindowRegistry.recordFailure('svc');
+
+    // Only 1 recent failure (other 2 expired), should still be closed
+    expect(shortWindowRegistry.getState('svc')).toBe('closed');
+    expect(shortWindowRegistry.getStats()['svc'].recentFailures).toBe(1);
   });
 
   it('should call onStateChange callback', () => {
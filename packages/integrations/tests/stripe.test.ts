@@ -1,4 +1,4 @@
-import { describe, it, expect } from 'vitest';
+import { describe, it, expect, vi } from 'vitest';
 import { SDKRegistry } from '@marktoflow/core';
 import { registerIntegrations, StripeInitializer, StripeClient } from '../src/index.js';
 
@@ -48,4 +48,24 @@ describe('Stripe Integration', () => {
     const result = await StripeInitializer.initialize({}, config);
     expect(result).toHaveProperty('client');
   });
+
+  it('should build the client from the module it is given', async () => {
+    const constructed = vi.fn();
+    class FakeStripe {
+      constructor(...args: unknown[]) {
+        constructed(...args);
+      }
+    }
+
+    const config = {
+      sdk: 'stripe',
+      auth: { api_key: 'sk_test_123456789' },
+    };
+
+    await StripeInitializer.initialize({ default: FakeStripe }, config);
+    expect(constructed).toHaveBeenCalledWith('sk_test_123456789', {
+      apiVersion: '2024-12-18.acacia',
+      typescript: true,
+    });
+  });
 });